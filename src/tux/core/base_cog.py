@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import weakref
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from discord.ext import commands
@@ -25,6 +27,13 @@ if TYPE_CHECKING:
 
 __all__ = ["BaseCog"]
 
+# Generated usage strings keyed by command callback. Usage only depends on the
+# callback signature, so re-instantiating a cog reuses it; a hot reload imports
+# new callbacks and the old entries are dropped along with the old functions.
+_USAGE_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], str] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class BaseCog(commands.Cog):
     """
@@ -84,7 +93,11 @@ class BaseCog(commands.Cog):
                     continue
 
                 # Generate usage from command signature and type hints
-                command.usage = self._generate_usage(command)
+                callback = command.callback
+                usage = _USAGE_CACHE.get(callback)
+                if usage is None:
+                    usage = _USAGE_CACHE[callback] = self._generate_usage(command)
+                command.usage = usage
 
         except Exception as e:
             # Log but don't crash - cog can still load without usage strings
@@ -439,12 +439,17 @@ class CogLoader(commands.Cog):
         # Recursively find all Python files in directory
         all_py_files = list(directory.rglob("*.py"))
 
+        # Eligibility checks read and parse each file, so run them concurrently
+        eligible = await asyncio.gather(
+            *[self.is_cog_eligible(item) for item in all_py_files],
+        )
+
         # Filter to eligible cogs and assign priorities
-        cog_paths: list[tuple[int, Path]] = []
-        for item in all_py_files:
-            if await self.is_cog_eligible(item):
-                priority = self._get_cog_priority(item)
-                cog_paths.append((priority, item))
+        cog_paths: list[tuple[int, Path]] = [
+            (self._get_cog_priority(item), item)
+            for item, is_eligible in zip(all_py_files, eligible, strict=True)
+            if is_eligible
+        ]
 
         # Sort by priority (highest first for sequential loading)
         cog_paths.sort(key=lambda x: x[0], reverse=True)
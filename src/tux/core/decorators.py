@@ -191,8 +191,8 @@ async def _get_user_rank_from_interaction(
     """
     Get user permission rank from an interaction (for app commands).
 
-    Uses discord.py's built-in Context.from_interaction() to create a proper
-    context, then queries the permission system for the user's rank.
+    Reads the guild and user straight from the interaction rather than
+    building a full context with Context.from_interaction().
 
     Parameters
     ----------
@@ -206,9 +206,10 @@ async def _get_user_rank_from_interaction(
     int
         The user permission rank.
     """
-    ctx: commands.Context[Any] = await commands.Context.from_interaction(interaction)  # type: ignore[reportUnknownMemberType]
-
-    return await permission_system.get_user_permission_rank(ctx)
+    return await permission_system.get_member_permission_rank(
+        interaction.guild,
+        interaction.user,
+    )
 
 
 def _extract_context_or_interaction(
@@ -230,7 +231,9 @@ def _extract_context_or_interaction(
     tuple[commands.Context[Any] | None, discord.Interaction[Any] | None]
         Tuple of (context, interaction). One will be None, the other populated.
     """
-    for arg in args:
+    # Command callbacks are invoked as (self, ctx_or_interaction, ...), so the
+    # second argument is checked first and usually matches straight away
+    for arg in args[1:2] + args:
         # Prefix commands use Context
         if isinstance(arg, commands.Context):
             return (cast(commands.Context[Any], arg), None)
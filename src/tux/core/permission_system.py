@@ -215,24 +215,49 @@ class PermissionSystem:
         ctx : commands.Context[Tux]
             The command context containing guild and user information.
 
+        Returns
+        -------
+        int
+            The highest permission rank (0-10) the user has, or 0 if none.
+        """
+        return await self.get_member_permission_rank(ctx.guild, ctx.author)
+
+    async def get_member_permission_rank(
+        self,
+        guild: discord.Guild | None,
+        user: discord.User | discord.Member,
+    ) -> int:
+        """
+        Get the highest permission rank a user has in a guild.
+
+        Works from the guild and user directly, so app command checks don't have
+        to build a full command context just to look up a rank.
+
+        Parameters
+        ----------
+        guild : discord.Guild | None
+            The guild to check, or None for DMs.
+        user : discord.User | discord.Member
+            The user whose roles are checked.
+
         Returns
         -------
         int
             The highest permission rank (0-10) the user has, or 0 if none.
         """
         # DM context has no permissions
-        if not ctx.guild:
+        if not guild:
             return 0
 
         # Extract role IDs from user's Discord roles
         user_roles = []
-        if isinstance(ctx.author, discord.Member):
-            user_roles = [role.id for role in ctx.author.roles]
+        if isinstance(user, discord.Member):
+            user_roles = [role.id for role in user.roles]
 
         # Query database for highest rank among user's roles
         return await self.db.permission_assignments.get_user_permission_rank(
-            ctx.guild.id,
-            ctx.author.id,
+            guild.id,
+            user.id,
             user_roles,
         )
 
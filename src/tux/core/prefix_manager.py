@@ -257,15 +257,14 @@ class PrefixManager:
 
                 # Load all guild configs with timeout to prevent blocking startup
                 logger.debug("Loading all guild prefixes into cache...")
-                all_configs = await asyncio.wait_for(
-                    controller.guild_config.find_all(limit=1000),  # Limit for safety
+                # Only the ID and prefix columns are fetched, limited for safety
+                all_prefixes = await asyncio.wait_for(
+                    controller.guild_config.get_all_prefixes(limit=1000),
                     timeout=10.0,  # Don't block startup for more than 10 seconds
                 )
 
-                # Populate cache with loaded configs
-                for config in all_configs:
-                    if hasattr(config, "id") and hasattr(config, "prefix"):
-                        self._prefix_cache[config.id] = config.prefix
+                # Populate cache with loaded prefixes
+                self._prefix_cache.update(all_prefixes)
 
                 self._cache_loaded = True
                 logger.info(
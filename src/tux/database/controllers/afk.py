@@ -10,6 +10,8 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlmodel import col
+
 from tux.database.controllers.base import BaseController
 from tux.database.models import AFK
 from tux.database.service import DatabaseService
@@ -42,6 +44,25 @@ class AfkController(BaseController[AFK]):
             filters=(AFK.member_id == member_id) & (AFK.guild_id == guild_id),
         )
 
+    async def get_afk_members(
+        self,
+        member_ids: list[int],
+        guild_id: int,
+    ) -> list[AFK]:
+        """
+        Get AFK status for several members of a guild in a single query.
+
+        Returns
+        -------
+        list[AFK]
+            The AFK records found, in no particular order.
+        """
+        if not member_ids:
+            return []
+        return await self.find_all(
+            filters=col(AFK.member_id).in_(member_ids) & (AFK.guild_id == guild_id),
+        )
+
     async def set_member_afk(
         self,
         member_id: int,
@@ -124,7 +145,9 @@ class AfkController(BaseController[AFK]):
         bool
             True if member is AFK, False otherwise.
         """
-        return await self.get_afk_by_member(member_id, guild_id) is not None
+        return await self.exists(
+            filters=(AFK.member_id == member_id) & (AFK.guild_id == guild_id),
+        )
 
     async def is_member_perm_afk(self, member_id: int, guild_id: int) -> bool:
         """
@@ -15,6 +15,8 @@ ModelT = TypeVar("ModelT", bound=SQLModel)
 class BulkOperationsController[ModelT]:
     """Handles bulk create, update, and delete operations."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the bulk operations controller.
 
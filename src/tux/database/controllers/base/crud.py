@@ -3,6 +3,7 @@
 from typing import Any, TypeVar
 
 from loguru import logger
+from sqlalchemy import literal
 from sqlmodel import SQLModel, select
 
 from tux.database.service import DatabaseService
@@ -15,6 +16,8 @@ ModelT = TypeVar("ModelT", bound=SQLModel)
 class CrudController[ModelT]:
     """Handles basic Create, Read, Update, Delete operations."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the CRUD controller.
 
@@ -119,9 +122,10 @@ class CrudController[ModelT]:
             True if record exists, False otherwise.
         """
         async with self.db.session() as session:
-            stmt = select(self.model)
+            # Select a constant and stop at the first match, no row is hydrated
+            stmt = select(literal(1)).select_from(self.model)
             filter_expr = build_filters_for_model(filters, self.model)
             if filter_expr is not None:
                 stmt = stmt.where(filter_expr)
-            result = await session.execute(stmt)
-            return result.scalars().first() is not None
+            result = await session.execute(stmt.limit(1))
+            return result.first() is not None
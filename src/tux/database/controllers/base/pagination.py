@@ -33,6 +33,8 @@ class PaginationResult[ModelT](BaseModel):
 class PaginationController[ModelT]:
     """Handles pagination logic and utilities."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the pagination controller.
 
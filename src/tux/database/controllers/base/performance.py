@@ -14,6 +14,8 @@ ModelT = TypeVar("ModelT", bound=SQLModel)
 class PerformanceController[ModelT]:
     """Handles query analysis and performance statistics."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the performance controller.
 
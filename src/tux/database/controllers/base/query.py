@@ -22,6 +22,8 @@ OrderByType = (
 class QueryController[ModelT]:
     """Handles query building, filtering, and advanced searches."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the query controller.
 
@@ -15,6 +15,8 @@ R = TypeVar("R")
 class TransactionController[ModelT]:
     """Handles transaction and session management."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the transaction controller.
 
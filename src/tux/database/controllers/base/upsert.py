@@ -15,6 +15,8 @@ ModelT = TypeVar("ModelT", bound=SQLModel)
 class UpsertController[ModelT]:
     """Handles upsert and get-or-create operations."""
 
+    __slots__ = ("db", "model")
+
     def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
         """Initialize the upsert controller.
 
@@ -7,7 +7,10 @@ preferences, moderation settings, and feature toggles for each guild.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
 from tux.database.controllers.base import BaseController
 from tux.database.models import GuildConfig
@@ -17,6 +20,16 @@ from tux.database.service import DatabaseService
 class GuildConfigController(BaseController[GuildConfig]):
     """Clean GuildConfig controller using the new BaseController pattern."""
 
+    # Map log types to config fields
+    LOG_CHANNEL_FIELDS: ClassVar[dict[str, str]] = {
+        "mod": "mod_log_id",
+        "audit": "audit_log_id",
+        "join": "join_log_id",
+        "private": "private_log_id",
+        "report": "report_log_id",
+        "dev": "dev_log_id",
+    }
+
     def __init__(self, db: DatabaseService | None = None) -> None:
         """Initialize the guild config controller.
 
@@ -86,6 +99,45 @@ class GuildConfigController(BaseController[GuildConfig]):
         """
         return await self.find_all()
 
+    async def get_all_prefixes(self, limit: int | None = None) -> dict[int, str]:
+        """
+        Get the command prefix of every guild configuration.
+
+        Only the ID and prefix columns are selected, so no full configuration
+        rows are loaded.
+
+        Parameters
+        ----------
+        limit : int | None, optional
+            Maximum number of guilds to load. Defaults to no limit.
+
+        Returns
+        -------
+        dict[int, str]
+            Mapping of guild ID to command prefix.
+        """
+
+        async def _op(session: AsyncSession) -> dict[int, str]:
+            """Select guild ID and prefix pairs.
+
+            Parameters
+            ----------
+            session : AsyncSession
+                The database session to use.
+
+            Returns
+            -------
+            dict[int, str]
+                Mapping of guild ID to command prefix.
+            """
+            stmt = select(GuildConfig.id, GuildConfig.prefix)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await session.execute(stmt)
+            return dict(result.tuples().all())
+
+        return await self.with_session(_op)
+
     async def get_config_count(self) -> int:
         """
         Get the total number of guild configurations.
@@ -575,18 +627,8 @@ class GuildConfigController(BaseController[GuildConfig]):
         if not config:
             return None
 
-        # Map log types to config fields
-        log_type_mapping = {
-            "mod": "mod_log_id",
-            "audit": "audit_log_id",
-            "join": "join_log_id",
-            "private": "private_log_id",
-            "report": "report_log_id",
-            "dev": "dev_log_id",
-        }
-
-        if log_type and log_type in log_type_mapping:
-            field_name = log_type_mapping[log_type]
+        if log_type and log_type in self.LOG_CHANNEL_FIELDS:
+            field_name = self.LOG_CHANNEL_FIELDS[log_type]
             return getattr(config, field_name, None)
 
         # Default to mod_log_id
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from loguru import logger
+from sqlmodel import col
 
 from tux.database.controllers.base import BaseController
 from tux.database.models.models import (
@@ -178,6 +179,8 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             The database service instance. If None, uses the default service.
         """
         super().__init__(PermissionAssignment, db)
+        # Built once and reused by get_user_permission_rank on every check
+        self._rank_controller = BaseController(PermissionRank, self.db)
 
     async def assign_permission_rank(
         self,
@@ -251,7 +254,6 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             return 0
 
         # Find the highest rank the user has access to
-        max_rank = 0
         assigned_role_ids = {assignment.role_id for assignment in assignments}
 
         # Check if user has any of the assigned roles
@@ -270,16 +272,12 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
         if not permission_rank_ids:
             return 0
 
-        # Query permission levels to get their numeric rank values
-
-        rank_controller = BaseController(PermissionRank, self.db)
-
-        for level_id in permission_rank_ids:
-            rank_record = await rank_controller.get_by_id(level_id)
-            if rank_record and rank_record.rank > max_rank:
-                max_rank = int(rank_record.rank)
+        # Fetch the numeric rank values in one query instead of one per level
+        rank_records = await self._rank_controller.find_all(
+            filters=col(PermissionRank.id).in_(permission_rank_ids),
+        )
 
-        return max_rank
+        return max((int(record.rank) for record in rank_records), default=0)
 
 
 class PermissionCommandController(BaseController[PermissionCommand]):
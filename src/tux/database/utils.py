@@ -113,6 +113,11 @@ def get_db_controller_from(
     db_service = get_db_service_from(source)
     if db_service is not None:
         try:
+            # Reuse the bot's cached coordinator when it wraps the same service,
+            # rather than building a new set of controllers on every call
+            bot = _resolve_bot(source)
+            if bot is not None and getattr(bot, "db_service", None) is db_service:
+                return bot.db
             # Create a simple coordinator wrapper
             return DatabaseCoordinator(db_service)
         except Exception as e:
@@ -34,6 +34,8 @@ class HelpData:
         self.ctx = ctx
         self._prefix_cache: dict[int | None, str] = {}
         self._category_cache: dict[str, dict[str, str]] = {}
+        # Rank of ctx.author, resolved once per help session rather than per command
+        self._user_rank: int | None = None
         self.command_mapping: (
             dict[str, dict[str, commands.Command[Any, Any, Any]]] | None
         ) = None
@@ -217,8 +219,11 @@ class HelpData:
                 return False
 
             # Get user's permission rank and check if user meets required rank
-            user_rank = await permission_system.get_user_permission_rank(self.ctx)
-            return user_rank >= cmd_perm.required_rank  # noqa: TRY300
+            if self._user_rank is None:
+                self._user_rank = await permission_system.get_user_permission_rank(
+                    self.ctx,
+                )
+            return self._user_rank >= cmd_perm.required_rank  # noqa: TRY300
         except Exception as e:
             logger.debug(f"Error checking permission rank for {command.name}: {e}")
             # On error, default to hiding the command for safety
@@ -45,6 +45,9 @@ class LevelsService(BaseCog):
         self.xp_roles = {
             role["level"]: role["role_id"] for role in CONFIG.XP_CONFIG.XP_ROLES
         }
+        # Sets for the membership checks done on every message and level-up
+        self.xp_role_ids = frozenset(self.xp_roles.values())
+        self.xp_blacklist_channels = frozenset(CONFIG.XP_CONFIG.XP_BLACKLIST_CHANNELS)
         self.xp_multipliers = {
             role["role_id"]: role["multiplier"]
             for role in CONFIG.XP_CONFIG.XP_MULTIPLIERS
@@ -65,7 +68,7 @@ class LevelsService(BaseCog):
         if (
             message.author.bot
             or message.guild is None
-            or message.channel.id in CONFIG.XP_CONFIG.XP_BLACKLIST_CHANNELS
+            or message.channel.id in self.xp_blacklist_channels
         ):
             return
 
@@ -94,21 +97,25 @@ class LevelsService(BaseCog):
         guild : discord.Guild
             The guild where the member is gaining XP.
         """
+        # Member.id is a proxied property, read the ids once for the queries below
+        member_id = member.id
+        guild_id = guild.id
+
         # Get blacklist status
-        is_blacklisted = await self.db.levels.is_blacklisted(member.id, guild.id)
+        is_blacklisted = await self.db.levels.is_blacklisted(member_id, guild_id)
         if is_blacklisted:
             return
 
         last_message_time = await self.db.levels.get_last_message_time(
-            member.id,
-            guild.id,
+            member_id,
+            guild_id,
         )
         if last_message_time and self.is_on_cooldown(last_message_time):
             return
 
         current_xp, current_level = await self.db.levels.get_xp_and_level(
-            member.id,
-            guild.id,
+            member_id,
+            guild_id,
         )
 
         xp_increment = self.calculate_xp_increment(member)
@@ -116,8 +123,8 @@ class LevelsService(BaseCog):
         new_level = self.calculate_level(new_xp)
 
         await self.db.levels.update_xp_and_level(
-            member.id,
-            guild.id,
+            member_id,
+            guild_id,
             xp=new_xp,
             level=new_level,
             last_message=datetime.datetime.fromtimestamp(time.time(), tz=datetime.UTC),
@@ -125,7 +132,11 @@ class LevelsService(BaseCog):
 
         if new_level > current_level:
             logger.debug(
-                f"User {member.name} leveled up from {current_level} to {new_level} in guild {guild.name}",
+                "User {} leveled up from {} to {} in guild {}",
+                member.name,
+                current_level,
+                new_level,
+                guild.name,
             )
             await self.handle_level_up(member, guild, new_level)
 
@@ -189,20 +200,22 @@ class LevelsService(BaseCog):
         new_level : int
             The new level of the member.
         """
-        roles_to_assign = [
-            guild.get_role(rid)
-            for lvl, rid in sorted(self.xp_roles.items())
-            if new_level >= lvl
-        ]
-        highest_role = roles_to_assign[-1] if roles_to_assign else None
+        # Only the highest qualifying role is assigned, so resolve just that one
+        highest_level = max(
+            (lvl for lvl in self.xp_roles if new_level >= lvl),
+            default=None,
+        )
+        highest_role = (
+            guild.get_role(self.xp_roles[highest_level])
+            if highest_level is not None
+            else None
+        )
 
         if highest_role:
             await self.try_assign_role(member, highest_role)
 
         roles_to_remove = [
-            r
-            for r in member.roles
-            if r.id in self.xp_roles.values() and r != highest_role
+            r for r in member.roles if r.id in self.xp_role_ids and r != highest_role
         ]
 
         await member.remove_roles(*roles_to_remove)
@@ -216,7 +229,12 @@ class LevelsService(BaseCog):
                 if roles_to_remove
                 else ""
             )
-            logger.debug(f"Updated roles for {member}: {assigned_text}{removed_text}")
+            logger.debug(
+                "Updated roles for {}: {}{}",
+                member,
+                assigned_text,
+                removed_text,
+            )
 
     @staticmethod
     async def try_assign_role(member: discord.Member, role: discord.Role) -> None:
@@ -6,6 +6,8 @@ latest comic, random comics, and specific comics by ID. Comics are displayed
 with interactive buttons for navigation to the comic's explanation and original page.
 """
 
+import asyncio
+
 import discord
 from discord.ext import commands
 from loguru import logger
@@ -36,6 +38,10 @@ class Xkcd(BaseCog):
         super().__init__(bot)
         self.client = xkcd.Client()
 
+    async def cog_unload(self) -> None:
+        """Close the xkcd client's HTTP connections when the cog is unloaded."""
+        self.client.close()
+
     @commands.hybrid_group(
         name="xkcd",
         aliases=["xk"],
@@ -140,12 +146,23 @@ class Xkcd(BaseCog):
             Tuple of (embed, view, success_flag).
         """
         try:
+            # The xkcd client does blocking HTTP, keep it off the event loop
             if latest:
-                comic = self.client.get_latest_comic(raw_comic_image=True)
+                comic = await asyncio.to_thread(
+                    self.client.get_latest_comic,
+                    raw_comic_image=True,
+                )
             elif number:
-                comic = self.client.get_comic(number, raw_comic_image=True)
+                comic = await asyncio.to_thread(
+                    self.client.get_comic,
+                    number,
+                    raw_comic_image=True,
+                )
             else:
-                comic = self.client.get_random_comic(raw_comic_image=True)
+                comic = await asyncio.to_thread(
+                    self.client.get_random_comic,
+                    raw_comic_image=True,
+                )
 
             embed = EmbedCreator.create_embed(
                 bot=self.bot,
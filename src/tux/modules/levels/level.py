@@ -73,8 +73,7 @@ class Level(BaseCog):
 
         logger.debug(f"Level check for {member.name} ({member.id}) in {ctx.guild.name}")
 
-        xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
-        level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
+        xp, level = await self.db.levels.get_xp_and_level(member.id, ctx.guild.id)
 
         logger.debug(f"Retrieved stats for {member.id}: Level {level}, XP {xp}")
 
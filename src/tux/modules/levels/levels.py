@@ -84,8 +84,10 @@ class Levels(BaseCog):
         """
         assert ctx.guild
 
-        old_level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
-        old_xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
+        old_xp, old_level = await self.db.levels.get_xp_and_level(
+            member.id,
+            ctx.guild.id,
+        )
 
         if embed_result := self.levels_service.valid_xplevel_input(new_level):
             logger.warning(
@@ -148,8 +150,10 @@ class Levels(BaseCog):
             await ctx.send(embed=embed_result)
             return
 
-        old_level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
-        old_xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
+        old_xp, old_level = await self.db.levels.get_xp_and_level(
+            member.id,
+            ctx.guild.id,
+        )
 
         new_level: int = self.levels_service.calculate_level(xp_amount)
         await self.db.levels.update_xp_and_level(
@@ -339,9 +339,10 @@ class Cases(ModerationCogBase):
             await ctx.send("No cases found.", ephemeral=True)
             return
 
-        total_cases = await self.db.case.get_all_cases(ctx.guild.id)
+        # Only the total is needed, so count in the database instead of loading rows
+        total_cases = await self.db.case.get_case_count_by_guild(ctx.guild.id)
 
-        await self._handle_case_list_response(ctx, cases, len(total_cases))
+        await self._handle_case_list_response(ctx, cases, total_cases)
 
     async def _update_case(
         self,
@@ -11,7 +11,6 @@ from tux.core.bot import Tux
 from tux.core.checks import requires_command_permission
 from tux.core.flags import UntimeoutFlags
 from tux.database.models import CaseType as DBCaseType
-from tux.shared.functions import generate_usage
 
 from . import ModerationCogBase
 
@@ -32,7 +31,6 @@ class Untimeout(ModerationCogBase):
             The bot instance to attach this cog to.
         """
         super().__init__(bot)
-        self.untimeout.usage = generate_usage(self.untimeout, UntimeoutFlags)
 
     @commands.hybrid_command(
         name="untimeout",
@@ -61,10 +61,13 @@ class SnippetInfo(SnippetsBaseCog):
             author.mention if author else f"<@!{snippet.snippet_user_id}> (Not found)"
         )
 
-        # Attempt to get aliases if any
+        # Attempt to get aliases if any, querying only those that point at this snippet
         aliases = [
             alias.snippet_name
-            for alias in (await self.db.snippet.get_all_aliases(ctx.guild.id))
+            for alias in await self.db.snippet.get_snippets_by_alias(
+                snippet.snippet_name,
+                ctx.guild.id,
+            )
         ]
 
         # Determine content field details
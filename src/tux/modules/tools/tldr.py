@@ -8,6 +8,11 @@ from various platforms with interactive pagination.
 
 import asyncio
 import contextlib
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from operator import itemgetter
+from typing import NamedTuple
 
 import discord
 from discord import app_commands
@@ -18,11 +23,53 @@ from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
 from tux.core.flags import TldrFlags
 from tux.services.sentry import capture_exception_safe
-from tux.services.wrappers.tldr import SUPPORTED_PLATFORMS, TldrClient
-from tux.shared.functions import generate_usage
+from tux.services.wrappers.tldr import (
+    MAX_CACHE_AGE_HOURS,
+    SUPPORTED_PLATFORMS,
+    TldrClient,
+)
+from tux.shared.constants import AUTOCOMPLETE_MAX_CHOICES
 from tux.ui.embeds import EmbedCreator
 from tux.ui.views.tldr import TldrPaginatorView
 
+# How long a scanned command list is reused by autocomplete before rescanning
+COMMAND_LIST_CACHE_TTL_SECONDS: float = 60.0
+# Maximum number of (language, platform) command indexes kept, since both come
+# from free-text slash options
+COMMAND_INDEX_CACHE_SIZE: int = 32
+# Maximum number of memoized (language, platform, query) autocomplete results
+FILTERED_CHOICES_CACHE_SIZE: int = 512
+# Shorter queries are matched as a prefix instead of anywhere in the name
+MIN_SUBSTRING_QUERY_LENGTH: int = 2
+# Maximum number of rendered TLDR pages kept for repeated lookups
+RENDERED_PAGES_CACHE_SIZE: int = 256
+# Rendered pages expire when the client would consider the page itself stale
+RENDERED_PAGES_CACHE_TTL_SECONDS: float = MAX_CACHE_AGE_HOURS * 3600.0
+# Language codes offered by the language autocomplete
+COMMON_LANGUAGES: tuple[str, ...] = (
+    "en",
+    "es",
+    "fr",
+    "de",
+    "pt",
+    "zh",
+    "ja",
+    "ko",
+    "ru",
+    "it",
+    "nl",
+    "pl",
+    "tr",
+)
+
+
+class _CommandIndex(NamedTuple):
+    """Snapshot of TLDR command names prepared for autocomplete lookups."""
+
+    fetched_at: float
+    lowered: list[tuple[str, str]]  # (name.lower(), name), sorted by lowercase
+    empty_choices: list[app_commands.Choice[str]]  # shared, must not be mutated
+
 
 class Tldr(BaseCog):
     """Discord cog for TLDR command integration."""
@@ -37,8 +84,22 @@ class Tldr(BaseCog):
         """
         super().__init__(bot)
         self.default_language: str = self.detect_bot_language()
-        self.prefix_tldr.usage = generate_usage(self.prefix_tldr, TldrFlags)
         self._cache_checked = False  # Track if cache has been checked
+        # (language, platform) -> command index, in LRU order
+        self._command_index_cache: OrderedDict[tuple[str, str], _CommandIndex] = (
+            OrderedDict()
+        )
+        # (language, platform, lowercased query) -> choices, in LRU order
+        self._filtered_choices_cache: OrderedDict[
+            tuple[str, str, str],
+            list[app_commands.Choice[str]],
+        ] = OrderedDict()
+        # (command, platform, language, show flags) -> (rendered_at, (title, pages)),
+        # in LRU order
+        self._rendered_pages_cache: OrderedDict[
+            tuple[str, str | None, str, bool, bool, bool],
+            tuple[float, tuple[str, list[str]]],
+        ] = OrderedDict()
 
     async def cog_load(self):
         """Schedule cache check when the cog is loaded (initial startup only)."""
@@ -69,45 +130,13 @@ class Tldr(BaseCog):
 
             languages_to_check = {normalized_default_lang, "en"}
 
-            for lang_code in languages_to_check:
-                if TldrClient.cache_needs_update(lang_code):
-                    logger.info(
-                        f"TLDR Cog: Cache for '{lang_code}' is older than 168 hours, updating...",
-                    )
-                    try:
-                        # Use asyncio.to_thread for cleaner async execution
-                        result_msg = await asyncio.to_thread(
-                            TldrClient.update_tldr_cache,
-                            lang_code,
-                        )
-                        if "Failed" in result_msg:
-                            logger.error(
-                                f"TLDR Cog: Cache update for '{lang_code}' - {result_msg}",
-                            )
-                        else:
-                            logger.debug(
-                                f"TLDR Cog: Cache update for '{lang_code}' - {result_msg}",
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"TLDR Cog: Exception during cache update for '{lang_code}': {e}",
-                            exc_info=True,
-                        )
-                        # Capture exception with context for Sentry
-                        capture_exception_safe(
-                            e,
-                            extra_context={
-                                "tldr_cache_update": {
-                                    "language": lang_code,
-                                    "operation": "cache_update",
-                                    "cache_needs_update": True,
-                                },
-                            },
-                        )
-                else:
-                    logger.debug(
-                        f"TLDR Cog: Cache for '{lang_code}' is recent, skipping update.",
-                    )
+            # At most two languages, so update them concurrently without a bound
+            await asyncio.gather(
+                *(
+                    self._update_language_cache(lang_code)
+                    for lang_code in languages_to_check
+                ),
+            )
 
             self._cache_checked = True
             logger.debug("TLDR Cog: Cache check completed.")
@@ -117,6 +146,58 @@ class Tldr(BaseCog):
                 exc_info=True,
             )
 
+    async def _update_language_cache(self, lang_code: str) -> None:
+        """
+        Refresh the on-disk TLDR cache for one language if it is stale.
+
+        Parameters
+        ----------
+        lang_code : str
+            The language whose pages should be checked and updated.
+        """
+        if TldrClient.cache_needs_update(lang_code):
+            logger.info(
+                f"TLDR Cog: Cache for '{lang_code}' is older than 168 hours, updating...",
+            )
+            try:
+                # Use asyncio.to_thread for cleaner async execution
+                result_msg = await asyncio.to_thread(
+                    TldrClient.update_tldr_cache,
+                    lang_code,
+                )
+                if "Failed" in result_msg:
+                    logger.error(
+                        f"TLDR Cog: Cache update for '{lang_code}' - {result_msg}",
+                    )
+                else:
+                    logger.debug(
+                        f"TLDR Cog: Cache update for '{lang_code}' - {result_msg}",
+                    )
+                    # Only this language's pages changed on disk
+                    self._invalidate_command_index(lang_code)
+                    # Pages fall back across languages, so drop them all
+                    self._rendered_pages_cache.clear()
+            except Exception as e:
+                logger.error(
+                    f"TLDR Cog: Exception during cache update for '{lang_code}': {e}",
+                    exc_info=True,
+                )
+                # Capture exception with context for Sentry
+                capture_exception_safe(
+                    e,
+                    extra_context={
+                        "tldr_cache_update": {
+                            "language": lang_code,
+                            "operation": "cache_update",
+                            "cache_needs_update": True,
+                        },
+                    },
+                )
+        else:
+            logger.debug(
+                f"TLDR Cog: Cache for '{lang_code}' is recent, skipping update.",
+            )
+
     def detect_bot_language(self) -> str:
         """
         Detect the bot's default language. For Discord bots, default to English.
@@ -128,6 +209,89 @@ class Tldr(BaseCog):
         """
         return "en"
 
+    def _get_command_index(self, language: str, platform: str) -> _CommandIndex:
+        """
+        Get the command index for a language and platform, cached with a TTL.
+
+        Autocomplete fires on nearly every keystroke, so the directory scan in
+        ``TldrClient.list_tldr_commands`` is only repeated once the cached entry
+        is older than ``COMMAND_LIST_CACHE_TTL_SECONDS``. The lowercased names
+        are built once per snapshot instead of once per keystroke.
+
+        Parameters
+        ----------
+        language : str
+            Language code to list commands for.
+        platform : str
+            Platform to list commands for.
+
+        Returns
+        -------
+        _CommandIndex
+            Sorted command names and their lowercased lookup pairs.
+        """
+        key = (language, platform)
+        now = time.monotonic()
+
+        cached = self._command_index_cache.get(key)
+        if (
+            cached is not None
+            and now - cached.fetched_at < COMMAND_LIST_CACHE_TTL_SECONDS
+        ):
+            self._command_index_cache.move_to_end(key)
+            return cached
+
+        command_names = TldrClient.list_tldr_commands(
+            language=language,
+            platform_filter=platform,
+        )
+        index = _CommandIndex(
+            fetched_at=now,
+            lowered=sorted((name.lower(), name) for name in command_names),
+            empty_choices=[
+                app_commands.Choice(name=cmd, value=cmd)
+                for cmd in command_names[:AUTOCOMPLETE_MAX_CHOICES]
+            ],
+        )
+        # Memoized results for this key were computed from the previous snapshot
+        self._invalidate_command_index(language, platform)
+        self._command_index_cache[key] = index
+        if len(self._command_index_cache) > COMMAND_INDEX_CACHE_SIZE:
+            self._command_index_cache.popitem(last=False)
+        return index
+
+    def _invalidate_command_index(
+        self,
+        language: str,
+        platform: str | None = None,
+    ) -> None:
+        """
+        Drop cached command indexes and memoized choices for a language.
+
+        Only the affected entries are removed so autocomplete for other
+        languages and platforms keeps its warm cache.
+
+        Parameters
+        ----------
+        language : str
+            Normalized language code whose entries should be dropped.
+        platform : str | None
+            Platform whose entries should be dropped, or None for all platforms.
+        """
+        for key in [
+            key
+            for key in self._command_index_cache
+            if key[0] == language and platform in (None, key[1])
+        ]:
+            del self._command_index_cache[key]
+
+        for memo_key in [
+            memo_key
+            for memo_key in self._filtered_choices_cache
+            if memo_key[0] == language and platform in (None, memo_key[1])
+        ]:
+            del self._filtered_choices_cache[memo_key]
+
     async def command_autocomplete(
         self,
         interaction: discord.Interaction,
@@ -149,26 +313,83 @@ class Tldr(BaseCog):
                 language_value = interaction.namespace.language
                 platform_value = interaction.namespace.platform
         final_language = language_value or self.default_language
+        # en_US, en_GB, ... all list the same pages, so share one cache entry
+        if final_language.startswith("en"):
+            final_language = "en"
         final_platform_for_list = platform_value or TldrClient.detect_platform()
 
-        commands_to_show = TldrClient.list_tldr_commands(
-            language=final_language,
-            platform_filter=final_platform_for_list,
-        )
+        index = self._get_command_index(final_language, final_platform_for_list)
+        if not current:
+            return index.empty_choices
+
+        # Repeated queries (backspacing, retyping) reuse the previous result
+        needle = current.lower()
+        memo_key = (final_language, final_platform_for_list, needle)
+        if (cached_choices := self._filtered_choices_cache.get(memo_key)) is not None:
+            self._filtered_choices_cache.move_to_end(memo_key)
+            return cached_choices
 
         # Filter commands based on current input
-        if not current:
-            filtered_commands = [
-                app_commands.Choice(name=cmd, value=cmd) for cmd in commands_to_show
-            ]
-        else:
-            filtered_commands = [
-                app_commands.Choice(name=cmd, value=cmd)
-                for cmd in commands_to_show
-                if current.lower() in cmd.lower()
-            ]
+        choices = self._match_commands(index, needle)
+
+        self._filtered_choices_cache[memo_key] = choices
+        if len(self._filtered_choices_cache) > FILTERED_CHOICES_CACHE_SIZE:
+            self._filtered_choices_cache.popitem(last=False)
+        return choices
+
+    @staticmethod
+    def _match_commands(
+        index: _CommandIndex,
+        needle: str,
+    ) -> list[app_commands.Choice[str]]:
+        """
+        Find commands matching a lowercased query, prefix matches first.
+
+        Prefix matches are contiguous in the sorted index, so they are located
+        with a binary search. Substring matches elsewhere in the name are only
+        scanned for when the prefix run doesn't fill the choice limit and the
+        query is long enough to be meaningful as a substring.
+
+        Parameters
+        ----------
+        index : _CommandIndex
+            The command index snapshot to search.
+        needle : str
+            The lowercased, non-empty query.
+
+        Returns
+        -------
+        list[app_commands.Choice[str]]
+            Up to ``AUTOCOMPLETE_MAX_CHOICES`` matching command choices.
+        """
+        lowered = index.lowered
+        choices: list[app_commands.Choice[str]] = []
+
+        position = bisect_left(lowered, needle, key=itemgetter(0))
+        while (
+            position < len(lowered)
+            and len(choices) < AUTOCOMPLETE_MAX_CHOICES
+            and lowered[position][0].startswith(needle)
+        ):
+            cmd = lowered[position][1]
+            choices.append(app_commands.Choice(name=cmd, value=cmd))
+            position += 1
+
+        # A single character is a substring of most names, prefix only
+        if (
+            len(choices) == AUTOCOMPLETE_MAX_CHOICES
+            or len(needle) < MIN_SUBSTRING_QUERY_LENGTH
+        ):
+            return choices
+
+        # Stop scanning as soon as Discord's choice limit is reached
+        for lowered_name, cmd in lowered:
+            if needle in lowered_name and not lowered_name.startswith(needle):
+                choices.append(app_commands.Choice(name=cmd, value=cmd))
+                if len(choices) == AUTOCOMPLETE_MAX_CHOICES:
+                    break
 
-        return filtered_commands[:25]
+        return choices
 
     async def platform_autocomplete(
         self,
@@ -183,10 +404,11 @@ class Tldr(BaseCog):
         list[app_commands.Choice[str]]
             List of platform choices for autocomplete.
         """
+        needle = current.lower()
         choices = [
             app_commands.Choice(name=plat, value=plat)
             for plat in SUPPORTED_PLATFORMS
-            if current.lower() in plat.lower()
+            if needle in plat
         ]
         return choices[:25]
 
@@ -203,25 +425,11 @@ class Tldr(BaseCog):
         list[app_commands.Choice[str]]
             List of language choices for autocomplete.
         """
-        common_languages = [
-            "en",
-            "es",
-            "fr",
-            "de",
-            "pt",
-            "zh",
-            "ja",
-            "ko",
-            "ru",
-            "it",
-            "nl",
-            "pl",
-            "tr",
-        ]
+        needle = current.lower()
         choices = [
             app_commands.Choice(name=lang, value=lang)
-            for lang in common_languages
-            if current.lower() in lang.lower()
+            for lang in COMMON_LANGUAGES
+            if needle in lang
         ]
         return choices[:25]
 
@@ -300,29 +508,74 @@ class Tldr(BaseCog):
             show_both=render_both,
         )
 
-    async def _handle_tldr_command_slash(
+    async def _render_tldr_pages(
         self,
-        interaction: discord.Interaction,
         command_name: str,
-        platform: str | None = None,
-        language: str | None = None,
-        show_short: bool = False,
-        show_long: bool = True,
-        show_both: bool = False,
-    ) -> None:
-        """Handle the TLDR command for slash commands."""
+        platform: str | None,
+        language: str | None,
+        *,
+        show_short: bool,
+        show_long: bool,
+        show_both: bool,
+    ) -> tuple[str, list[str]]:
+        """
+        Fetch a TLDR page and split it into embed-sized pages.
+
+        Shared by the slash and prefix handlers, which only differ in how the
+        result is sent.
+
+        Parameters
+        ----------
+        command_name : str
+            The command to look up.
+        platform : str | None
+            The requested platform, or None to use the detected platform.
+        language : str | None
+            The requested language, or None to use the bot language.
+        show_short : bool
+            Display shortform options over longform.
+        show_long : bool
+            Display longform options over shortform.
+        show_both : bool
+            Display both short and long options.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            The embed title and the rendered description pages.
+        """
         command_norm = TldrClient.normalize_page_name(command_name)
         chosen_language = language or self.default_language
+
+        # Rendered pages only change when the page is refreshed, either by a
+        # cache update or by the client re-downloading it once it is stale
+        render_key = (
+            command_norm,
+            platform,
+            chosen_language,
+            show_short,
+            show_long,
+            show_both,
+        )
+        now = time.monotonic()
+        if (cached := self._rendered_pages_cache.get(render_key)) is not None:
+            rendered_at, rendered = cached
+            if now - rendered_at < RENDERED_PAGES_CACHE_TTL_SECONDS:
+                self._rendered_pages_cache.move_to_end(render_key)
+                return rendered
+
         languages_to_try = TldrClient.get_language_priority(chosen_language)
 
-        if result := TldrClient.fetch_tldr_page(
+        # Page fetching uses blocking urllib, keep it off the event loop
+        if page := await asyncio.to_thread(
+            TldrClient.fetch_tldr_page,
             command_norm,
             languages_to_try,
             platform,
         ):
-            page_content, found_platform = result
+            found_platform = page.platform
             description = TldrClient.format_tldr_for_discord(
-                page_content,
+                page.content,
                 show_short,
                 show_long,
                 show_both,
@@ -337,10 +590,36 @@ class Tldr(BaseCog):
                 warning_msg = f"\n\n⚠️ **Note**: This page is from `{found_platform}` platform, not `{expected_platform}` as expected."
                 description = warning_msg + "\n\n" + description
 
-        else:
-            description = TldrClient.not_found_message(command_norm)
-            embed_title = f"TLDR for {command_norm}"
-        pages = TldrClient.split_long_text(description)
+            rendered = (embed_title, TldrClient.split_long_text(description))
+            self._rendered_pages_cache[render_key] = (now, rendered)
+            self._rendered_pages_cache.move_to_end(render_key)
+            if len(self._rendered_pages_cache) > RENDERED_PAGES_CACHE_SIZE:
+                self._rendered_pages_cache.popitem(last=False)
+            return rendered
+
+        # Misses aren't cached, the page may be published upstream later
+        description = TldrClient.not_found_message(command_norm)
+        return f"TLDR for {command_norm}", TldrClient.split_long_text(description)
+
+    async def _handle_tldr_command_slash(
+        self,
+        interaction: discord.Interaction,
+        command_name: str,
+        platform: str | None = None,
+        language: str | None = None,
+        show_short: bool = False,
+        show_long: bool = True,
+        show_both: bool = False,
+    ) -> None:
+        """Handle the TLDR command for slash commands."""
+        embed_title, pages = await self._render_tldr_pages(
+            command_name,
+            platform,
+            language,
+            show_short=show_short,
+            show_long=show_long,
+            show_both=show_both,
+        )
         if not pages:
             await interaction.response.send_message(
                 "Could not render TLDR page.",
@@ -384,36 +663,14 @@ class Tldr(BaseCog):
         show_both: bool = False,
     ) -> None:
         """Handle the TLDR command for prefix commands."""
-        command_norm = TldrClient.normalize_page_name(command_name)
-        chosen_language = language or self.default_language
-        languages_to_try = TldrClient.get_language_priority(chosen_language)
-
-        if result := TldrClient.fetch_tldr_page(
-            command_norm,
-            languages_to_try,
+        embed_title, pages = await self._render_tldr_pages(
+            command_name,
             platform,
-        ):
-            page_content, found_platform = result
-            description = TldrClient.format_tldr_for_discord(
-                page_content,
-                show_short,
-                show_long,
-                show_both,
-            )
-            embed_title = (
-                f"TLDR for {command_norm} ({found_platform}/{chosen_language})"
-            )
-
-            # Add warning if page found on different platform than requested/detected
-            expected_platform = platform or TldrClient.detect_platform()
-            if found_platform not in (expected_platform, "common"):
-                warning_msg = f"\n\n⚠️ **Note**: This page is from `{found_platform}` platform, not `{expected_platform}` as expected."
-                description = warning_msg + "\n\n" + description
-
-        else:
-            description = TldrClient.not_found_message(command_norm)
-            embed_title = f"TLDR for {command_norm}"
-        pages = TldrClient.split_long_text(description)
+            language,
+            show_short=show_short,
+            show_long=show_long,
+            show_both=show_both,
+        )
         if not pages:
             await ctx.send("Could not render TLDR page.")
             return
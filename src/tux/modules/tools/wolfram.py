@@ -1,9 +1,10 @@
 """Wolfram cog for Tux Bot."""
 
+import asyncio
 import io
-from urllib.parse import quote_plus
+import time
+from collections import OrderedDict
 
-import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -12,9 +13,39 @@ from PIL import Image
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.services.http_client import http_client
 from tux.shared.config import CONFIG
 from tux.ui.embeds import EmbedCreator
 
+WOLFRAM_SIMPLE_API_URL = "https://api.wolframalpha.com/v1/simple"
+# How long rendered results are reused for repeated queries, and how many are kept.
+# Kept short since answers about time, weather or prices go stale quickly
+WOLFRAM_RESULT_CACHE_TTL_SECONDS = 60.0
+WOLFRAM_RESULT_CACHE_SIZE = 64
+
+
+def _crop_result_image(img_data: bytes) -> bytes:
+    """
+    Crop the Wolfram|Alpha header banner from a Simple API result image.
+
+    Parameters
+    ----------
+    img_data : bytes
+        The raw image returned by the Simple API.
+
+    Returns
+    -------
+    bytes
+        The encoded cropped image.
+    """
+    # Crop the top 80 pixels from the fetched image
+    image = Image.open(io.BytesIO(img_data))
+    width, height = image.size
+    cropped = image.crop((0, 80, width, height))
+    buffer = io.BytesIO()
+    cropped.save(buffer, format=image.format or "PNG")
+    return buffer.getvalue()
+
 
 class Wolfram(BaseCog):
     """Wolfram cog for Tux Bot."""
@@ -29,6 +60,8 @@ class Wolfram(BaseCog):
             The bot instance.
         """
         super().__init__(bot)
+        # normalized query -> (cached_at, cropped image), least recently used first
+        self._result_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
 
         # Verify AppID configuration; unload cog if missing
         if self.unload_if_missing_config(
@@ -52,6 +85,9 @@ class Wolfram(BaseCog):
         """
         Send a query to Wolfram|Alpha Simple API and return the visual result.
 
+        Repeated queries within ``WOLFRAM_RESULT_CACHE_TTL_SECONDS`` are answered
+        from the cached image, so time-sensitive answers may lag by that much.
+
         Parameters
         ----------
         ctx : commands.Context[Tux]
@@ -61,19 +97,24 @@ class Wolfram(BaseCog):
         """
         await ctx.defer()
 
-        # Build the Simple API endpoint URL with URL-encoded query
-        encoded = quote_plus(query)
-        url = f"https://api.wolframalpha.com/v1/simple?appid={CONFIG.EXTERNAL_SERVICES.WOLFRAM_APP_ID}&i={encoded}"
+        # Queries differing only in spacing share one cache entry. Case is kept,
+        # Wolfram|Alpha input is case-sensitive ("Co" is cobalt, "CO" is not)
+        cache_key = " ".join(query.split())
+        now = time.monotonic()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None and now - cached[0] < WOLFRAM_RESULT_CACHE_TTL_SECONDS:
+            self._result_cache.move_to_end(cache_key)
+            await self._send_result(ctx, query, cached[1])
+            return
 
         try:
-            # Perform async HTTP GET with a 10-second timeout
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get(url, timeout=timeout) as resp,
-            ):
-                resp.raise_for_status()
-                img_data = await resp.read()
+            # Reuse the shared client's connection pool, with a 10-second timeout
+            response = await http_client.get(
+                WOLFRAM_SIMPLE_API_URL,
+                params={"appid": CONFIG.EXTERNAL_SERVICES.WOLFRAM_APP_ID, "i": query},
+                timeout=10.0,
+            )
+            img_data = response.content
         except Exception:
             # On error, notify user via an error embed
             embed = EmbedCreator.create_embed(
@@ -86,14 +127,36 @@ class Wolfram(BaseCog):
             await ctx.send(embed=embed)
             return
 
-        # Crop the top 80 pixels from the fetched image
-        image = Image.open(io.BytesIO(img_data))
-        width, height = image.size
-        cropped = image.crop((0, 80, width, height))
-        buffer = io.BytesIO()
-        cropped.save(buffer, format=image.format or "PNG")
-        buffer.seek(0)
-        image_file = discord.File(buffer, filename="wolfram.png")
+        # Decoding and re-encoding the image is CPU-bound, keep it off the event loop
+        image_data = await asyncio.to_thread(_crop_result_image, img_data)
+
+        # Failures return early above, so only successful results are cached
+        self._result_cache[cache_key] = (now, image_data)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > WOLFRAM_RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+        await self._send_result(ctx, query, image_data)
+
+    async def _send_result(
+        self,
+        ctx: commands.Context[Tux],
+        query: str,
+        image_data: bytes,
+    ) -> None:
+        """
+        Send a Wolfram|Alpha result image in an embed.
+
+        Parameters
+        ----------
+        ctx : commands.Context[Tux]
+            Invocation context for the command.
+        query : str
+            The query the image answers, used in the embed title.
+        image_data : bytes
+            The cropped result image.
+        """
+        image_file = discord.File(io.BytesIO(image_data), filename="wolfram.png")
 
         embed = EmbedCreator.create_embed(
             bot=self.bot,
@@ -197,7 +197,11 @@ class Afk(BaseCog):
         # Suppress Forbidden errors if the bot doesn't have permission to change the nickname
         with contextlib.suppress(discord.Forbidden):
             await message.author.edit(nick=entry.nickname)
-            logger.debug(f"Nickname restored for {message.author.id}: {entry.nickname}")
+            logger.debug(
+                "Nickname restored for {}: {}",
+                message.author.id,
+                entry.nickname,
+            )
 
     @commands.Cog.listener("on_message")
     async def check_afk(self, message: discord.Message) -> None:
@@ -222,18 +226,25 @@ class Afk(BaseCog):
         if message.content.startswith(f"{prefix}sto"):
             return
 
-        afks_mentioned: list[tuple[discord.Member, AFKMODEL]] = []
-
-        for mentioned in message.mentions:
-            entry = await self._get_afk_entry(mentioned.id, message.guild.id)
-            if entry:
-                afks_mentioned.append((cast(discord.Member, mentioned), entry))
+        # Fetch every mentioned member's AFK entry in one query instead of one each
+        member_ids = [mentioned.id for mentioned in message.mentions]
+        entries = {
+            entry.member_id: entry
+            for entry in await self.db.afk.get_afk_members(member_ids, message.guild.id)
+        }
+        afks_mentioned: list[tuple[discord.Member, AFKMODEL]] = [
+            (cast(discord.Member, mentioned), entries[mentioned.id])
+            for mentioned in message.mentions
+            if mentioned.id in entries
+        ]
 
         if not afks_mentioned:
             return
 
         logger.debug(
-            f"AFK notification: {len(afks_mentioned)} AFK users mentioned in {message.guild.name}",
+            "AFK notification: {} AFK users mentioned in {}",
+            len(afks_mentioned),
+            message.guild.name,
         )
 
         msgs: list[str] = [
@@ -7,6 +7,7 @@ algorithms including Base16, Base32, Base64, and Base85 with Discord integration
 
 import base64
 import binascii
+from collections.abc import Callable
 
 from discord import AllowedMentions, app_commands
 from discord.ext import commands
@@ -14,7 +15,6 @@ from loguru import logger
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
-from tux.shared.functions import generate_usage
 
 
 def wrap_strings(wrapper: str, contents: list[str]) -> list[str]:
@@ -53,6 +53,19 @@ SUPPORTED_FORMATS_MESSAGE = [
     "base64",
     "base85",
 ]
+# Encoding name -> codec function, looked up once per command invocation
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {
+    "base16": base64.b16encode,
+    "base32": base64.b32encode,
+    "base64": base64.b64encode,
+    "base85": base64.b85encode,
+}
+DECODERS: dict[str, Callable[[bytes], bytes]] = {
+    "base16": base64.b16decode,
+    "base32": base64.b32decode,
+    "base64": base64.b64decode,
+    "base85": base64.b85decode,
+}
 
 
 class EncodeDecode(BaseCog):
@@ -67,9 +80,7 @@ class EncodeDecode(BaseCog):
         bot : Tux
             The bot instance.
         """
-        self.bot = bot
-        self.encode.usage = generate_usage(self.encode)
-        self.decode.usage = generate_usage(self.decode)
+        super().__init__(bot)
 
     async def send_message(self, ctx: commands.Context[Tux], data: str):
         """Reply to the context with the encoded or decoded data.
@@ -129,20 +140,18 @@ class EncodeDecode(BaseCog):
         encoding = encoding.lower()
         btext = text.encode(encoding="utf-8")
 
+        # Positional arguments are only formatted if a DEBUG handler is active
         logger.debug(
-            f"Encoding request: {encoding} from {ctx.author.name} ({ctx.author.id}), text length: {len(text)}",
+            "Encoding request: {} from {} ({}), text length: {}",
+            encoding,
+            ctx.author.name,
+            ctx.author.id,
+            len(text),
         )
 
         try:
-            if encoding == "base16":
-                data = base64.b16encode(btext)
-            elif encoding == "base32":
-                data = base64.b32encode(btext)
-            elif encoding == "base64":
-                data = base64.b64encode(btext)
-            elif encoding == "base85":
-                data = base64.b85encode(btext)
-            else:
+            encoder = ENCODERS.get(encoding)
+            if encoder is None:
                 logger.warning(
                     f"Invalid encoding '{encoding}' requested by {ctx.author.id}",
                 )
@@ -153,7 +162,12 @@ class EncodeDecode(BaseCog):
                 )
                 return
 
-            logger.debug(f"Encoding successful: {encoding}, output length: {len(data)}")
+            data = encoder(btext)
+            logger.debug(
+                "Encoding successful: {}, output length: {}",
+                encoding,
+                len(data),
+            )
             await self.send_message(ctx, data.decode(encoding="utf-8"))
         except Exception as e:
             logger.error(f"Encoding error ({encoding}): {type(e).__name__}: {e}")
@@ -194,19 +208,16 @@ class EncodeDecode(BaseCog):
         btext = text.encode(encoding="utf-8")
 
         logger.debug(
-            f"Decoding request: {encoding} from {ctx.author.name} ({ctx.author.id}), text length: {len(text)}",
+            "Decoding request: {} from {} ({}), text length: {}",
+            encoding,
+            ctx.author.name,
+            ctx.author.id,
+            len(text),
         )
 
         try:
-            if encoding == "base16":
-                data = base64.b16decode(btext)
-            elif encoding == "base32":
-                data = base64.b32decode(btext)
-            elif encoding == "base64":
-                data = base64.b64decode(btext)
-            elif encoding == "base85":
-                data = base64.b85decode(btext)
-            else:
+            decoder = DECODERS.get(encoding)
+            if decoder is None:
                 logger.warning(
                     f"Invalid decoding format '{encoding}' requested by {ctx.author.id}",
                 )
@@ -217,7 +228,12 @@ class EncodeDecode(BaseCog):
                 )
                 return
 
-            logger.debug(f"Decoding successful: {encoding}, output length: {len(data)}")
+            data = decoder(btext)
+            logger.debug(
+                "Decoding successful: {}, output length: {}",
+                encoding,
+                len(data),
+            )
             await self.send_message(ctx, data.decode(encoding="utf-8"))
         except binascii.Error as e:
             logger.warning(f"Decoding error for {encoding} from {ctx.author.id}: {e}")
@@ -148,6 +148,19 @@ def _remove_backticks(text: str) -> str:
     return BACKTICKS_PATTERN.sub("", text)
 
 
+async def _close_message_callback(interaction: discord.Interaction) -> None:
+    """
+    Delete the message a close button is attached to.
+
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        The button interaction.
+    """
+    if interaction.message:
+        await interaction.message.delete()
+
+
 class CodeDispatch(ABC):
     """Abstract base class for code execution services."""
 
@@ -422,17 +435,11 @@ class Run(BaseCog):
         discord.ui.View
             The view with close button.
         """
-
-        async def close_callback(interaction: discord.Interaction) -> None:
-            """Handle the close button callback to delete the message."""
-            if interaction.message:
-                await interaction.message.delete()
-
         button = discord.ui.Button[discord.ui.View](
             style=discord.ButtonStyle.red,
             label="✖ Close",
         )
-        button.callback = close_callback
+        button.callback = _close_message_callback
 
         view = discord.ui.View()
         view.add_item(button)
@@ -5,6 +5,11 @@ This module provides commands to search and retrieve information from
 Arch Linux Wiki and ATL Wiki, with formatted Discord embeds for results.
 """
 
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, NamedTuple
+
 import discord
 from discord.ext import commands
 from loguru import logger
@@ -13,8 +18,42 @@ from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
 from tux.services.http_client import http_client
 from tux.services.sentry import capture_api_error
+from tux.shared.exceptions import TuxAPIRequestError
 from tux.ui.embeds import EmbedCreator
 
+# Maximum number of in-flight API requests per wiki, to stay clear of rate limits
+MAX_CONCURRENT_WIKI_REQUESTS = 4
+# How long search results are reused for repeated queries, and how many are kept
+WIKI_RESULT_CACHE_TTL_SECONDS = 600.0
+WIKI_RESULT_CACHE_SIZE = 4096
+# MediaWiki parameters shared by every query, only titles and srsearch vary. The
+# exact title lookup and the search fallback ride in one request
+WIKI_QUERY_PARAMS: dict[str, str] = {
+    "action": "query",
+    "format": "json",
+    "redirects": "1",
+    "list": "search",
+    # Only the top hit's title is used, so skip snippets, sizes and search info
+    "srlimit": "1",
+    "srprop": "",
+    "srinfo": "",
+}
+# MediaWiki titles are capped at 255 bytes, longer search terms are not sent
+WIKI_MAX_QUERY_LENGTH = 255
+# Characters MediaWiki forbids in page titles, such terms skip the exact title lookup
+WIKI_INVALID_TITLE_CHARS = frozenset("#<>[]|{}")
+
+
+class WikiResult(NamedTuple):
+    """Title and article URL of the top wiki search hit."""
+
+    title: str
+    url: str
+
+
+# Returned when a search has no hits or the wiki API request fails
+WIKI_NOT_FOUND = WikiResult("error", "error")
+
 
 class Wiki(BaseCog):
     """Discord cog for wiki search functionality."""
@@ -30,10 +69,23 @@ class Wiki(BaseCog):
         super().__init__(bot)
         self.arch_wiki_api_url = "https://wiki.archlinux.org/api.php"
         self.atl_wiki_api_url = "https://atl.wiki/api.php"
+        # Article URL prefix for each wiki API, resolved once instead of per query
+        self._article_base_urls: dict[str, str] = {
+            self.arch_wiki_api_url: "https://wiki.archlinux.org/title/",
+            self.atl_wiki_api_url: "https://atl.wiki/",
+        }
+        self._request_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(MAX_CONCURRENT_WIKI_REQUESTS),
+        )
+        # (api url, search term) -> (cached_at, result), least recently used first
+        self._result_cache: OrderedDict[
+            tuple[str, str],
+            tuple[float, WikiResult],
+        ] = OrderedDict()
 
     def create_embed(
         self,
-        title: tuple[str, str],
+        result: WikiResult,
         ctx: commands.Context[Tux],
     ) -> discord.Embed:
         """
@@ -41,9 +93,9 @@ class Wiki(BaseCog):
 
         Parameters
         ----------
-        title : tuple[str, str]
-            A tuple containing the title and description of the search result.
-            If the first element is "error", it indicates no search results were found.
+        result : WikiResult
+            The title and URL of the search result, or ``WIKI_NOT_FOUND`` if no
+            search results were found.
         ctx : commands.Context[Tux]
             The context object for the command.
 
@@ -52,26 +104,25 @@ class Wiki(BaseCog):
         discord.Embed
             The created embed message.
         """
-        if title[0] == "error":
-            embed = EmbedCreator.create_embed(
-                bot=self.bot,
-                embed_type=EmbedCreator.ERROR,
-                user_name=ctx.author.name,
-                user_display_avatar=ctx.author.display_avatar.url,
-                description="No search results found.",
+        if result == WIKI_NOT_FOUND:
+            embed_type, title, description = (
+                EmbedCreator.ERROR,
+                None,
+                "No search results found.",
             )
         else:
-            embed = EmbedCreator.create_embed(
-                bot=self.bot,
-                embed_type=EmbedCreator.INFO,
-                user_name=ctx.author.name,
-                user_display_avatar=ctx.author.display_avatar.url,
-                title=title[0],
-                description=title[1],
-            )
-        return embed
+            embed_type, title, description = EmbedCreator.INFO, *result
+
+        return EmbedCreator.create_embed(
+            bot=self.bot,
+            embed_type=embed_type,
+            user_name=ctx.author.name,
+            user_display_avatar=ctx.author.display_avatar.url,
+            title=title,
+            description=description,
+        )
 
-    async def query_wiki(self, base_url: str, search_term: str) -> tuple[str, str]:
+    async def query_wiki(self, base_url: str, search_term: str) -> WikiResult:
         """
         Query a wiki API for a search term and return the title and URL of the first search result.
 
@@ -84,44 +135,178 @@ class Wiki(BaseCog):
 
         Returns
         -------
-        tuple[str, str]
-            The title and URL of the first search result.
-        """
-        search_term = search_term.capitalize()
-        params: dict[str, str] = {
-            "action": "query",
-            "format": "json",
-            "list": "search",
-            "srsearch": search_term,
-        }
+        WikiResult
+            The title and URL of the first search result, or ``WIKI_NOT_FOUND``.
+        """
+        search_term = search_term.strip().capitalize()
+
+        # Terms that cannot match anything are answered without a round trip
+        if not search_term or len(search_term.encode()) > WIKI_MAX_QUERY_LENGTH:
+            return WIKI_NOT_FOUND
+
+        # Popular searches are served from memory instead of the wiki API
+        cache_key = (base_url, search_term)
+        now = time.monotonic()
+        if (cached := self._result_cache.get(cache_key)) is not None:
+            cached_at, cached_result = cached
+            if now - cached_at < WIKI_RESULT_CACHE_TTL_SECONDS:
+                # Popular terms stay resident, the TTL still bounds staleness
+                self._result_cache.move_to_end(cache_key)
+                return cached_result
+
+        params = {**WIKI_QUERY_PARAMS, "srsearch": search_term}
+        if WIKI_INVALID_TITLE_CHARS.isdisjoint(search_term):
+            params["titles"] = search_term
 
         try:
-            # Send a GET request to the wiki API
-            response = await http_client.get(base_url, params=params)
-            logger.info(f"GET request to {base_url} with params {params!r}")
-            response.raise_for_status()
-
-            # Parse JSON response
-            data = response.json()
-            logger.info(f"Wiki API response: {data!r}")
-
-            if data.get("query") and data["query"].get("search"):
-                search_results = data["query"]["search"]
-                if search_results:
-                    title = search_results[0]["title"]
-                    url_title = title.replace(" ", "_")
-                    if "atl.wiki" in base_url:
-                        url = f"https://atl.wiki/{url_title}"
-                    else:
-                        url = f"https://wiki.archlinux.org/title/{url_title}"
-                    return title, url
+            data = await self._get_json(base_url, params)
+
+            # Prefer the page with that exact title, fall back to the top search hit
+            title = self._find_exact_title(data)
+            if title is None:
+                title = self._find_top_search_title(data)
+
+            result = WIKI_NOT_FOUND
+            if title is not None:
+                url_title = title.replace(" ", "_")
+                article_base_url = self._article_base_urls.get(
+                    base_url,
+                    self._article_base_urls[self.arch_wiki_api_url],
+                )
+                result = WikiResult(title, f"{article_base_url}{url_title}")
         except Exception as e:
-            logger.error(f"Wiki API request failed: {e}")
+            logger.error("Wiki API request failed: {}", e)
 
             capture_api_error(e, endpoint="wiki_api")
-            return "error", "error"
+            # Failures are transient, so they are not cached
+            return WIKI_NOT_FOUND
+
+        # Not-found results are cached too, so repeated bogus terms stay local
+        self._result_cache[cache_key] = (now, result)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > WIKI_RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
-        return "error", "error"
+        return result
+
+    async def _get_json(self, base_url: str, params: dict[str, str]) -> dict[str, Any]:
+        """
+        Send a GET request to a wiki API and return the decoded JSON payload.
+
+        Parameters
+        ----------
+        base_url : str
+            The base URL of the wiki API.
+        params : dict[str, str]
+            The query string parameters.
+
+        Returns
+        -------
+        dict[str, Any]
+            The decoded response body.
+
+        Raises
+        ------
+        TuxAPIRequestError
+            If the response is not JSON.
+        """
+        # Bounded per wiki to stay clear of rate limits
+        async with self._request_semaphores[base_url]:
+            response = await http_client.get(base_url, params=params)
+        logger.debug("GET request to {} with params {!r}", base_url, params)
+
+        # Misconfigured or down wikis often answer 200 with an HTML page, reject
+        # those up front rather than attempting to decode them as JSON
+        content_type = response.headers.get("content-type", "")
+        if not content_type.startswith("application/json"):
+            raise TuxAPIRequestError(
+                service_name="wiki",
+                status_code=response.status_code,
+                reason=f"unexpected content type {content_type!r}",
+            )
+
+        data = response.json()
+        # Formatting is deferred, the payload is only repr'd if DEBUG is on
+        logger.debug("Wiki API response: {!r}", data)
+        return data
+
+    @staticmethod
+    def _find_exact_title(data: dict[str, Any]) -> str | None:
+        """
+        Extract the page matching the queried title, following redirects.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The decoded wiki API response.
+
+        Returns
+        -------
+        str | None
+            The resolved page title, or None if no such page exists.
+        """
+        try:
+            pages = data["query"]["pages"]
+        except KeyError:
+            return None
+
+        for page in pages.values():
+            if "missing" not in page and "invalid" not in page:
+                return page["title"]
+        return None
+
+    @staticmethod
+    def _find_top_search_title(data: dict[str, Any]) -> str | None:
+        """
+        Extract the title of the top full-text search hit.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The decoded wiki API response.
+
+        Returns
+        -------
+        str | None
+            The title of the first search result, or None if there are no hits.
+        """
+        try:
+            return data["query"]["search"][0]["title"]
+        except (KeyError, IndexError):
+            return None
+
+    async def _send_wiki_result(
+        self,
+        ctx: commands.Context[Tux],
+        base_url: str,
+        query: str,
+    ) -> None:
+        """
+        Search a wiki and reply with the top result.
+
+        Parameters
+        ----------
+        ctx : commands.Context[Tux]
+            The context object for the command.
+        base_url : str
+            The base URL of the wiki API.
+        query : str
+            The search query.
+        """
+        # Claim the interaction while the wiki API request is in flight. Both are
+        # awaited to completion, so a failed defer neither discards the result
+        # nor leaves the query running
+        result, deferred = await asyncio.gather(
+            self.query_wiki(base_url, query),
+            ctx.defer(),
+            return_exceptions=True,
+        )
+        if isinstance(result, BaseException):
+            raise result
+        if isinstance(deferred, BaseException):
+            logger.warning("Could not defer wiki response: {}", deferred)
+
+        await ctx.send(embed=self.create_embed(result, ctx))
 
     @commands.hybrid_group(
         name="wiki",
@@ -153,11 +338,7 @@ class Wiki(BaseCog):
         query : str
             The search query.
         """
-        title: tuple[str, str] = await self.query_wiki(self.arch_wiki_api_url, query)
-
-        embed = self.create_embed(title, ctx)
-
-        await ctx.send(embed=embed)
+        await self._send_wiki_result(ctx, self.arch_wiki_api_url, query)
 
     @wiki.command(
         name="atl",
@@ -173,11 +354,7 @@ class Wiki(BaseCog):
         query : str
             The search query.
         """
-        title: tuple[str, str] = await self.query_wiki(self.atl_wiki_api_url, query)
-
-        embed = self.create_embed(title, ctx)
-
-        await ctx.send(embed=embed)
+        await self._send_wiki_result(ctx, self.atl_wiki_api_url, query)
 
 
 async def setup(bot: Tux) -> None:
@@ -6,6 +6,7 @@ image processing transformations that create a "deepfried" visual effect,
 including saturation, contrast, and color adjustments.
 """
 
+import asyncio
 import io
 from typing import Any
 
@@ -69,12 +70,10 @@ class Deepfry(BaseCog):
 
         if getattr(pil_image, "is_animated", False):
             try:
-                frames: list[Image.Image] = []
-                durations: list[int] = []
-                for frame in ImageSequence.Iterator(pil_image):
-                    processed = self._deepfry_image(frame.convert("RGB"))
-                    frames.append(processed)
-                    durations.append(frame.info.get("duration", 50))
+                frames, durations = await asyncio.to_thread(
+                    self._deepfry_frames,
+                    pil_image,
+                )
 
                 if not frames:
                     await self._send_error_embed(
@@ -95,7 +94,10 @@ class Deepfry(BaseCog):
         else:
             # Process the image
             try:
-                deepfried_image = self._deepfry_image(pil_image)
+                deepfried_image = await asyncio.to_thread(
+                    self._deepfry_image,
+                    pil_image,
+                )
                 await self._send_image_result(ctx, deepfried_image)
             except Exception as e:
                 logger.error(f"Error processing deepfry: {e}")
@@ -132,6 +134,30 @@ class Deepfry(BaseCog):
         response = await http_client.get(url)
         return Image.open(io.BytesIO(response.content))
 
+    def _deepfry_frames(
+        self,
+        image: Image.Image,
+    ) -> tuple[list[Image.Image], list[int]]:
+        """
+        Apply deepfry effects to every frame of an animated image.
+
+        Parameters
+        ----------
+        image : Image.Image
+            The animated image to process.
+
+        Returns
+        -------
+        tuple[list[Image.Image], list[int]]
+            The deepfried frames and their durations in milliseconds.
+        """
+        frames: list[Image.Image] = []
+        durations: list[int] = []
+        for frame in ImageSequence.Iterator(image):
+            frames.append(self._deepfry_image(frame.convert("RGB")))
+            durations.append(frame.info.get("duration", 50))
+        return frames, durations
+
     def _deepfry_image(self, image: Image.Image) -> Image.Image:
         """
         Apply deepfry effects to an image.
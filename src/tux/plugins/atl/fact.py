@@ -21,6 +21,7 @@ from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
 from tux.services.http_client import http_client
 from tux.shared.config import CONFIG
+from tux.shared.constants import AUTOCOMPLETE_MAX_CHOICES
 from tux.shared.version import get_version
 from tux.ui.embeds import EmbedCreator
 
@@ -171,16 +172,21 @@ class Fact(BaseCog):
         list[app_commands.Choice[str]]
             List of autocomplete choices.
         """
-        choices = [app_commands.Choice(name="Random", value="random")] + [
-            app_commands.Choice(
-                name=_substitute_placeholders(self.bot, data.get("name", key.title())),
-                value=key,
-            )
-            for key, data in self.facts_data.items()
-        ]
-        if current:
-            choices = [c for c in choices if current.lower() in c.name.lower()]
-        return choices[:25]
+        # Build choices for matches only, instead of materializing every fact
+        # type (with placeholder substitution) and then filtering and slicing
+        needle = current.lower()
+        choices: list[app_commands.Choice[str]] = []
+        if needle in "random":
+            choices.append(app_commands.Choice(name="Random", value="random"))
+
+        for key, data in self.facts_data.items():
+            if len(choices) == AUTOCOMPLETE_MAX_CHOICES:
+                break
+            name = _substitute_placeholders(self.bot, data.get("name", key.title()))
+            if needle in name.lower():
+                choices.append(app_commands.Choice(name=name, value=key))
+
+        return choices
 
     @commands.hybrid_command(name="fact", aliases=["funfact"])
     @app_commands.describe(fact_type="Select the category of fact to retrieve")
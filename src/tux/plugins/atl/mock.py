@@ -7,7 +7,7 @@ error handling mechanisms in the bot.
 """
 
 import asyncio
-from typing import Any
+from typing import Any, NamedTuple
 
 import discord
 import httpx
@@ -18,10 +18,27 @@ from loguru import logger
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
 from tux.core.checks import requires_command_permission
-from tux.services.handlers.error.formatter import ERROR_CONFIG_MAP
+from tux.services.handlers.error.config import ERROR_CONFIG_MAP
 from tux.shared.config import CONFIG
+from tux.shared.constants import AUTOCOMPLETE_MAX_CHOICES
 from tux.ui.embeds import EmbedCreator
 
+# Errors suggested before a category is picked, as (lowercased, name) in name order
+COMMON_ERROR_NAMES: tuple[tuple[str, str], ...] = tuple(
+    sorted(
+        (name.lower(), name)
+        for name in (
+            "ValueError",
+            "RuntimeError",
+            "App_MissingRole_str",
+            "Cmd_MissingPermissions",
+            "Forbidden",
+            "App_CommandOnCooldown",
+            "Cmd_CommandOnCooldown",
+        )
+    ),
+)
+
 
 # Minimal Mock Objects for Required Arguments
 class MockParameter:
@@ -924,6 +941,15 @@ class ErrorTestRegistry:
         return self.tests.get(name)
 
 
+class _ErrorIndexes(NamedTuple):
+    """Autocomplete entries over the error registry, case-folded once."""
+
+    # (display name, lowercased name, name), sorted by display name
+    by_type: tuple[tuple[str, str, str], ...]
+    # Same entries per category, plus "All" for every error
+    by_category: dict[str, tuple[tuple[str, str, str], ...]]
+
+
 class Mock(BaseCog):
     """Mock plugin for Tux Bot."""
 
@@ -937,7 +963,59 @@ class Mock(BaseCog):
             The bot instance.
         """
         super().__init__(bot)
-        self.error_registry = ErrorTestRegistry()
+        # Built on first use, most sessions never run a mock command
+        self._error_registry: ErrorTestRegistry | None = None
+        self._error_indexes: _ErrorIndexes | None = None
+
+    @property
+    def error_registry(self) -> ErrorTestRegistry:
+        """
+        Registry of testable errors, built on first access.
+
+        Returns
+        -------
+        ErrorTestRegistry
+            The error test registry.
+        """
+        if self._error_registry is None:
+            self._error_registry = ErrorTestRegistry()
+        return self._error_registry
+
+    @property
+    def error_indexes(self) -> _ErrorIndexes:
+        """
+        Autocomplete indexes over the error registry, built on first access.
+
+        Returns
+        -------
+        _ErrorIndexes
+            The per-type and per-category autocomplete entries.
+        """
+        if self._error_indexes is None:
+            registry = self.error_registry
+            tests = registry.tests
+            by_category: dict[str, tuple[tuple[str, str, str], ...]] = {
+                "All": tuple(
+                    sorted(
+                        (f"{name} [{test_def.category}]", name.lower(), name)
+                        for name, test_def in tests.items()
+                    ),
+                ),
+            }
+            for category, names in registry.get_test_names_by_category().items():
+                by_category[category] = tuple(
+                    sorted((name, name.lower(), name) for name in names),
+                )
+            self._error_indexes = _ErrorIndexes(
+                by_type=tuple(
+                    sorted(
+                        (f"[{test_def.category}] {name}", name.lower(), name)
+                        for name, test_def in tests.items()
+                    ),
+                ),
+                by_category=by_category,
+            )
+        return self._error_indexes
 
     async def _create_error_info_embed(
         self,
@@ -1125,6 +1203,8 @@ class Mock(BaseCog):
         list[app_commands.Choice[str]]
             List of autocomplete choices (max 25).
         """
+        needle = current.lower()
+
         # Get the category from the current interaction
         category = None
         if interaction.namespace:
@@ -1132,53 +1212,24 @@ class Mock(BaseCog):
 
         if not category:
             # If no category selected yet, show popular/common errors
-            common_errors = [
-                "ValueError",
-                "RuntimeError",
-                "App_MissingRole_str",
-                "Cmd_MissingPermissions",
-                "Forbidden",
-                "App_CommandOnCooldown",
-                "Cmd_CommandOnCooldown",
-            ]
-            choices = [
+            return [
                 app_commands.Choice(name=error_name, value=error_name)
-                for error_name in common_errors
-                if current.lower() in error_name.lower()
-            ]
-        else:
-            # Filter errors by the selected category
-            categories = self.error_registry.get_test_names_by_category()
-
-            if category == "All":
-                # Show all errors if "All" is selected
-                available_errors = self.error_registry.get_test_names()
-            else:
-                # Show only errors from the selected category
-                available_errors = categories.get(category, [])
-
-            # Filter based on current input and limit to 25
-            filtered_errors = [
-                error_name
-                for error_name in available_errors
-                if current.lower() in error_name.lower()
+                for lowered, error_name in COMMON_ERROR_NAMES
+                if needle in lowered
             ]
 
-            choices = [
-                app_commands.Choice(
-                    name=(
-                        f"{error_name} [{self.error_registry.tests[error_name].category}]"
-                        if category == "All" and error_name in self.error_registry.tests
-                        else error_name
-                    ),
-                    value=error_name,
-                )
-                for error_name in filtered_errors
-            ]
-
-        # Sort and limit choices
-        choices.sort(key=lambda x: x.name)
-        return choices[:25]
+        # Filter errors by the selected category ("All" shows every error);
+        # the index is already sorted, so stop once the limit is reached
+        choices = []
+        for display_name, lowered, error_name in self.error_indexes.by_category.get(
+            category,
+            (),
+        ):
+            if needle in lowered:
+                choices.append(app_commands.Choice(name=display_name, value=error_name))
+                if len(choices) == AUTOCOMPLETE_MAX_CHOICES:
+                    break
+        return choices
 
     @mock.command(
         name="error",
@@ -1430,15 +1481,25 @@ class Mock(BaseCog):
         list[app_commands.Choice[str]]
             List of autocomplete choices with category prefix (max 25).
         """
-        choices = [
-            app_commands.Choice(name=f"[{test_def.category}] {name}", value=name)
-            for name, test_def in self.error_registry.tests.items()
-            if current.lower() in name.lower()
-        ]
-
-        # Sort by category, then by name, and limit to 25
-        choices.sort(key=lambda x: x.name)
-        return choices[:25]
+        needle = current.lower()
+
+        # The index is sorted by category, then by name; names starting with
+        # the query are ranked ahead of names that merely contain it
+        prefix_choices: list[app_commands.Choice[str]] = []
+        substring_choices: list[app_commands.Choice[str]] = []
+        for display_name, lowered, name in self.error_indexes.by_type:
+            if lowered.startswith(needle):
+                prefix_choices.append(
+                    app_commands.Choice(name=display_name, value=name),
+                )
+                if len(prefix_choices) == AUTOCOMPLETE_MAX_CHOICES:
+                    break
+            elif needle in lowered:
+                substring_choices.append(
+                    app_commands.Choice(name=display_name, value=name),
+                )
+
+        return (prefix_choices + substring_choices)[:AUTOCOMPLETE_MAX_CHOICES]
 
     # Add a separate command for the old-style interface for prefix commands
     @mock.command(
@@ -17,7 +17,7 @@ from tux.services.sentry import (
     track_command_end,
 )
 
-from .config import ERROR_CONFIG_MAP, ErrorHandlerConfig
+from .config import ErrorHandlerConfig, get_error_config_for_type
 from .extractors import unwrap_error
 from .formatter import ErrorFormatter
 from .suggestions import CommandSuggester
@@ -129,19 +129,7 @@ class ErrorHandler(commands.Cog):
         ErrorHandlerConfig
             Configuration for the error type.
         """
-        error_type = type(error)
-
-        # Check exact match
-        if error_type in ERROR_CONFIG_MAP:
-            return ERROR_CONFIG_MAP[error_type]
-
-        # Check parent classes
-        for base_type in error_type.__mro__:
-            if base_type in ERROR_CONFIG_MAP:
-                return ERROR_CONFIG_MAP[base_type]
-
-        # Default config
-        return ErrorHandlerConfig()
+        return get_error_config_for_type(type(error))
 
     def _log_error(self, error: Exception, config: ErrorHandlerConfig) -> None:
         """Log error with appropriate level."""
@@ -163,16 +151,21 @@ class ErrorHandler(commands.Cog):
         config: ErrorHandlerConfig,
     ) -> None:
         """Send error response to user."""
+        if isinstance(source, discord.Interaction):
+            # App command - ephemeral response
+            send = (
+                source.followup.send
+                if source.response.is_done()
+                else source.response.send_message
+            )
+            response = send(embed=embed, ephemeral=True)
+        # Prefix command
+        else:
+            response = source.reply(embed=embed, mention_author=False)
+
+        # Only the network call can fail
         try:
-            if isinstance(source, discord.Interaction):
-                # App command - ephemeral response
-                if source.response.is_done():
-                    await source.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await source.response.send_message(embed=embed, ephemeral=True)
-            # Prefix command
-            else:
-                await source.reply(embed=embed, mention_author=False)
+            await response
         except discord.HTTPException as e:
             logger.warning(f"Failed to send error response: {e}")
 
@@ -1,5 +1,6 @@
 """Error handler configuration."""
 
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -34,7 +35,7 @@ DEFAULT_MAX_DISTANCE_THRESHOLD = 3
 ErrorDetailExtractor = Callable[..., dict[str, Any]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorHandlerConfig:
     """Configuration for handling a specific error type."""
 
@@ -606,3 +607,29 @@ ERROR_CONFIG_MAP: dict[type[Exception], ErrorHandlerConfig] = {
         log_level="ERROR",
     ),
 }
+
+
+@functools.lru_cache(maxsize=256)
+def get_error_config_for_type(error_type: type[Exception]) -> ErrorHandlerConfig:
+    """
+    Resolve the handler configuration for an exception type.
+
+    The result only depends on the type, so the MRO walk runs once per type
+    and later errors of the same type are a single cached lookup.
+
+    Parameters
+    ----------
+    error_type : type[Exception]
+        The exception type to resolve.
+
+    Returns
+    -------
+    ErrorHandlerConfig
+        The configuration of the most specific mapped type in the MRO, or a
+        default configuration if none is mapped.
+    """
+    for base_type in error_type.__mro__:
+        if base_type in ERROR_CONFIG_MAP:
+            return ERROR_CONFIG_MAP[base_type]
+
+    return ErrorHandlerConfig()
@@ -8,7 +8,7 @@ from discord.ext import commands
 
 from tux.core.bot import Tux
 
-from .config import ERROR_CONFIG_MAP, ErrorHandlerConfig
+from .config import ErrorHandlerConfig, get_error_config_for_type
 from .extractors import fallback_format_message
 
 
@@ -119,16 +119,4 @@ class ErrorFormatter:
         ErrorHandlerConfig
             Configuration for the error type.
         """
-        error_type = type(error)
-
-        # Check exact match
-        if error_type in ERROR_CONFIG_MAP:
-            return ERROR_CONFIG_MAP[error_type]
-
-        # Check parent classes
-        for base_type in error_type.__mro__:
-            if base_type in ERROR_CONFIG_MAP:
-                return ERROR_CONFIG_MAP[base_type]
-
-        # Default config
-        return ErrorHandlerConfig()
+        return get_error_config_for_type(type(error))
@@ -34,6 +34,8 @@ class CommandSuggester:
             return None
 
         command_name = ctx.invoked_with
+        # Normalized once here rather than for every candidate name below
+        command_name_lower = command_name.lower()
 
         # Use stricter limits for short commands
         is_short = len(command_name) <= SHORT_CMD_LEN_THRESHOLD
@@ -62,7 +64,7 @@ class CommandSuggester:
                 names_to_check.append(cmd.name)
 
             for name in names_to_check:
-                distance = Levenshtein.distance(command_name.lower(), name.lower())
+                distance = Levenshtein.distance(command_name_lower, name.lower())
                 if distance < min_dist:
                     min_dist = distance
                     best_name = (
@@ -23,6 +23,10 @@ class EventHandler(BaseCog):
         """
         super().__init__(bot)
         self._guilds_registered = False
+        # Resolved once, on_message checks these for every message the bot sees
+        self._bridge_webhook_ids = frozenset(CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS)
+        prefix = CONFIG.get_prefix()
+        self._bridge_command_prefixes = (f"{prefix}s ", f"{prefix}snippet ")
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -98,9 +102,9 @@ class EventHandler(BaseCog):
     async def on_message(self, message: discord.Message) -> None:
         """On message event handler."""
         # Allow the IRC bridge to use the snippet command only
-        if message.webhook_id in CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS and (
-            message.content.startswith(f"{CONFIG.get_prefix()}s ")
-            or message.content.startswith(f"{CONFIG.get_prefix()}snippet ")
+        if (
+            message.webhook_id in self._bridge_webhook_ids
+            and message.content.startswith(self._bridge_command_prefixes)
         ):
             ctx = await self.bot.get_context(message)
             await self.bot.invoke(ctx)
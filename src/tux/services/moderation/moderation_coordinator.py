@@ -39,6 +39,17 @@ class ModerationCoordinator:
         DBCaseType.TEMPBAN,
     }
 
+    # Past-tense action descriptions used in DMs when no custom one is given
+    DEFAULT_DM_ACTIONS: ClassVar[dict[DBCaseType, str]] = {
+        DBCaseType.BAN: "banned",
+        DBCaseType.KICK: "kicked",
+        DBCaseType.TEMPBAN: "temporarily banned",
+        DBCaseType.TIMEOUT: "timed out",
+        DBCaseType.WARN: "warned",
+        DBCaseType.UNBAN: "unbanned",
+        DBCaseType.UNTIMEOUT: "untimeout",
+    }
+
     def __init__(
         self,
         case_service: CaseService,
@@ -484,13 +495,4 @@ class ModerationCoordinator:
         str
             Default action description for the case type.
         """
-        action_mapping = {
-            DBCaseType.BAN: "banned",
-            DBCaseType.KICK: "kicked",
-            DBCaseType.TEMPBAN: "temporarily banned",
-            DBCaseType.TIMEOUT: "timed out",
-            DBCaseType.WARN: "warned",
-            DBCaseType.UNBAN: "unbanned",
-            DBCaseType.UNTIMEOUT: "untimeout",
-        }
-        return action_mapping.get(case_type, "moderated")
+        return self.DEFAULT_DM_ACTIONS.get(case_type, "moderated")
@@ -46,6 +46,8 @@ class DummySpan:
     even if Sentry is disabled.
     """
 
+    __slots__ = ("start_time",)
+
     def __init__(self) -> None:
         """Initialize the dummy span."""
         self.start_time = time.perf_counter()
@@ -103,6 +105,8 @@ class DummyTransaction(DummySpan):
     `start_transaction` context manager.
     """
 
+    __slots__ = ()
+
 
 # --- Common Helpers ---
 
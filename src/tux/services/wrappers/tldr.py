@@ -7,6 +7,7 @@ This wrapper contains no Discord dependencies and can be used independently.
 """
 
 import contextlib
+import functools
 import os
 import re
 import shutil
@@ -14,6 +15,7 @@ import time
 import zipfile
 from io import BytesIO
 from pathlib import Path
+from typing import NamedTuple
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -47,6 +49,37 @@ PLATFORM_MAPPINGS = {
 SUPPORTED_PLATFORMS = sorted([*set(PLATFORM_MAPPINGS.values()), "common"])
 
 
+@functools.lru_cache(maxsize=128)
+def _platform_cache_dir(language: str, platform: str) -> Path:
+    """
+    Resolve the cache directory holding one language's pages for a platform.
+
+    A single lookup probes every language and platform in priority order, so
+    the directory is built once per pair rather than on every probe.
+
+    Parameters
+    ----------
+    language : str
+        Language code (en, es, fr, etc.).
+    platform : str
+        Target platform (linux, osx, windows, etc.).
+
+    Returns
+    -------
+    Path
+        The directory containing that platform's cached pages.
+    """
+    pages_dir = f"pages.{language}" if language != "en" else "pages"
+    return CACHE_DIR / pages_dir / platform
+
+
+class TldrPage(NamedTuple):
+    """Raw markdown of a TLDR page and the platform it was found under."""
+
+    content: str
+    platform: str
+
+
 class TldrClient:
     """
     Core TLDR client functionality for fetching and managing pages.
@@ -98,8 +131,7 @@ class TldrClient:
         Path
             Full path to the cached page file.
         """
-        pages_dir = f"pages{f'.{language}' if language != 'en' else ''}"
-        return CACHE_DIR / pages_dir / platform / f"{command}.md"
+        return _platform_cache_dir(language, platform) / f"{command}.md"
 
     @staticmethod
     def have_recent_cache(command: str, platform: str, language: str) -> bool:
@@ -279,7 +311,7 @@ class TldrClient:
         command: str,
         languages: list[str],
         platform_preference: str | None = None,
-    ) -> tuple[str, str] | None:
+    ) -> TldrPage | None:
         """
         Fetch a TLDR page with platform priority and language fallback.
 
@@ -294,8 +326,8 @@ class TldrClient:
 
         Returns
         -------
-        tuple[str, str] | None
-            Tuple of (page_content, found_platform) if successful, None if not found.
+        TldrPage | None
+            The page content and the platform it was found under, None if not found.
 
         Notes
         -----
@@ -314,7 +346,7 @@ class TldrClient:
                         language,
                     )
                 ):
-                    return (cache_content, platform)
+                    return TldrPage(cache_content, platform)
 
                 # Fetch from remote
                 suffix = f".{language}" if language != "en" else ""
@@ -330,7 +362,7 @@ class TldrClient:
                             platform,
                             language,
                         )
-                        return (page_content, platform)
+                        return TldrPage(page_content, platform)
                 except (HTTPError, URLError):
                     continue  # Try next platform/language combination
 
@@ -392,11 +424,10 @@ class TldrClient:
                 if not path.exists() or not path.is_dir():
                     continue
 
-                # Collect all .md files
-                found_in_platform: set[str] = {
+                # Collect all .md files straight into the result set
+                commands_set.update(
                     file.stem for file in path.iterdir() if file.suffix == ".md"
-                }
-                commands_set.update(found_in_platform)
+                )
             except OSError:
                 continue
 
@@ -161,6 +161,15 @@ class Client:
         """
         self._api_url = api_url
         self._explanation_wiki_url = explanation_wiki_url
+        # Fixed for the client's lifetime, built once instead of on every request
+        self._latest_comic_url = f"{api_url}/info.0.json"
+        # Pooled connections are reused across requests instead of a new handshake
+        # for each one, a random comic alone takes up to three requests
+        self._http_client = httpx.Client()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections held by the client."""
+        self._http_client.close()
 
     def latest_comic_url(self) -> str:
         """
@@ -171,7 +180,7 @@ class Client:
         str
             The URL for the latest comic.
         """
-        return f"{self._api_url}/info.0.json"
+        return self._latest_comic_url
 
     def comic_id_url(self, comic_id: int) -> str:
         """
@@ -318,7 +327,7 @@ class Client:
         )
 
         try:
-            response = httpx.get(comic_url)
+            response = self._http_client.get(comic_url)
             response.raise_for_status()
 
         except httpx.HTTPStatusError as exc:
@@ -340,8 +349,7 @@ class Client:
 
         return response.text
 
-    @staticmethod
-    def _request_raw_image(raw_image_url: str | None) -> bytes:
+    def _request_raw_image(self, raw_image_url: str | None) -> bytes:
         """
         Request the raw image data from the xkcd API.
 
@@ -371,7 +379,7 @@ class Client:
             )
 
         try:
-            response = httpx.get(raw_image_url)
+            response = self._http_client.get(raw_image_url)
             response.raise_for_status()
 
         except httpx.HTTPStatusError as exc:
@@ -140,6 +140,7 @@ SLASH_CMD_NAME_LENGTH: Final[int] = 32
 SLASH_CMD_MAX_DESC_LENGTH: Final[int] = 100
 SLASH_CMD_MAX_OPTIONS: Final[int] = 25
 SLASH_OPTION_NAME_LENGTH: Final[int] = 100
+AUTOCOMPLETE_MAX_CHOICES: Final[int] = 25
 
 DEFAULT_REASON: Final[str] = "No reason provided"
 
@@ -25,6 +25,23 @@ __all__ = [
     "truncate",
 ]
 
+# Single-unit duration such as '60s' or '2h', compiled once at import
+TIME_STRING_PATTERN = re.compile(r"^(?P<value>\d+)(?P<unit>[smhdw])$")
+# timedelta keyword argument for each duration unit
+TIME_UNIT_KWARGS: dict[str, str] = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+}
+# Markdown patterns removed by strip_formatting, compiled once since it runs per message
+CODE_BLOCK_PATTERN = re.compile(r"```(.*?)```")
+INLINE_CODE_PATTERN = re.compile(r"`([^`]*)`")
+HEADER_PATTERN = re.compile(r"^#+\s+", flags=re.MULTILINE)
+FORMATTING_CHARS_PATTERN = re.compile(r"[\*_~>]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def truncate(text: str, length: int) -> str:
     """Truncate a string to a specified length.
@@ -62,15 +79,15 @@ def strip_formatting(content: str) -> str:
         The string with formatting stripped.
     """
     # Remove triple backtick blocks
-    content = re.sub(r"```(.*?)```", r"\1", content)
+    content = CODE_BLOCK_PATTERN.sub(r"\1", content)
     # Remove single backtick code blocks
-    content = re.sub(r"`([^`]*)`", r"\1", content)
+    content = INLINE_CODE_PATTERN.sub(r"\1", content)
     # Remove Markdown headers
-    content = re.sub(r"^#+\s+", "", content, flags=re.MULTILINE)
+    content = HEADER_PATTERN.sub("", content)
     # Remove markdown formatting characters, but preserve |
-    content = re.sub(r"[\*_~>]", "", content)
+    content = FORMATTING_CHARS_PATTERN.sub("", content)
     # Remove extra whitespace
-    content = re.sub(r"\s+", " ", content)
+    content = WHITESPACE_PATTERN.sub(" ", content)
 
     return content.strip()
 
@@ -94,11 +111,8 @@ def parse_time_string(time_str: str) -> timedelta:
     ValueError
         If the time format is invalid.
     """
-    # Define regex pattern to parse time strings
-    time_pattern = re.compile(r"^(?P<value>\d+)(?P<unit>[smhdw])$")
-
     # Match the input string with the pattern
-    match = time_pattern.match(time_str)
+    match = TIME_STRING_PATTERN.match(time_str)
 
     if not match:
         msg = f"Invalid time format: '{time_str}'"
@@ -108,16 +122,13 @@ def parse_time_string(time_str: str) -> timedelta:
     value = int(match["value"])
     unit = match["unit"]
 
-    # Define the mapping of units to keyword arguments for timedelta
-    unit_map = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
-
     # Check if the unit is in the map
-    if unit not in unit_map:
+    if unit not in TIME_UNIT_KWARGS:
         msg = f"Unknown time unit: '{unit}'"
         raise ValueError(msg)
 
     # Create the timedelta with the appropriate keyword argument
-    kwargs = {unit_map[unit]: value}
+    kwargs = {TIME_UNIT_KWARGS[unit]: value}
 
     return timedelta(**kwargs)
 
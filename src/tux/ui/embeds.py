@@ -35,6 +35,61 @@ class EmbedType(Enum):
     INACTIVE_CASE = 10
 
 
+# Colour, author icon and author label for each embed type, built once at import
+_EMBED_TYPE_SETTINGS: dict[EmbedType, tuple[discord.Colour, str, str]] = {
+    EmbedType.DEFAULT: (
+        discord.Colour(EMBED_COLORS["DEFAULT"]),
+        EMBED_ICONS["DEFAULT"],
+        "Default",
+    ),
+    EmbedType.INFO: (
+        discord.Colour(EMBED_COLORS["INFO"]),
+        EMBED_ICONS["INFO"],
+        "Info",
+    ),
+    EmbedType.ERROR: (
+        discord.Colour(EMBED_COLORS["ERROR"]),
+        EMBED_ICONS["ERROR"],
+        "Error",
+    ),
+    EmbedType.WARNING: (
+        discord.Colour(EMBED_COLORS["WARNING"]),
+        EMBED_ICONS["DEFAULT"],
+        "Warning",
+    ),
+    EmbedType.SUCCESS: (
+        discord.Colour(EMBED_COLORS["SUCCESS"]),
+        EMBED_ICONS["SUCCESS"],
+        "Success",
+    ),
+    EmbedType.POLL: (
+        discord.Colour(EMBED_COLORS["POLL"]),
+        EMBED_ICONS["POLL"],
+        "Poll",
+    ),
+    EmbedType.CASE: (
+        discord.Colour(EMBED_COLORS["CASE"]),
+        EMBED_ICONS["CASE"],
+        "Case",
+    ),
+    EmbedType.ACTIVE_CASE: (
+        discord.Colour(EMBED_COLORS["CASE"]),
+        EMBED_ICONS["ACTIVE_CASE"],
+        "Active Case",
+    ),
+    EmbedType.INACTIVE_CASE: (
+        discord.Colour(EMBED_COLORS["CASE"]),
+        EMBED_ICONS["INACTIVE_CASE"],
+        "Inactive Case",
+    ),
+    EmbedType.NOTE: (
+        discord.Colour(EMBED_COLORS["NOTE"]),
+        EMBED_ICONS["NOTE"],
+        "Note",
+    ),
+}
+
+
 class EmbedCreator:
     """Utility class for creating standardized Discord embeds."""
 
@@ -115,52 +170,19 @@ class EmbedCreator:
         try:
             embed: discord.Embed = discord.Embed(title=title, description=description)
 
-            type_settings: dict[EmbedType, tuple[int, str, str]] = {
-                EmbedType.DEFAULT: (
-                    EMBED_COLORS["DEFAULT"],
-                    EMBED_ICONS["DEFAULT"],
-                    "Default",
-                ),
-                EmbedType.INFO: (EMBED_COLORS["INFO"], EMBED_ICONS["INFO"], "Info"),
-                EmbedType.ERROR: (EMBED_COLORS["ERROR"], EMBED_ICONS["ERROR"], "Error"),
-                EmbedType.WARNING: (
-                    EMBED_COLORS["WARNING"],
-                    EMBED_ICONS["DEFAULT"],
-                    "Warning",
-                ),
-                EmbedType.SUCCESS: (
-                    EMBED_COLORS["SUCCESS"],
-                    EMBED_ICONS["SUCCESS"],
-                    "Success",
-                ),
-                EmbedType.POLL: (EMBED_COLORS["POLL"], EMBED_ICONS["POLL"], "Poll"),
-                EmbedType.CASE: (EMBED_COLORS["CASE"], EMBED_ICONS["CASE"], "Case"),
-                EmbedType.ACTIVE_CASE: (
-                    EMBED_COLORS["CASE"],
-                    EMBED_ICONS["ACTIVE_CASE"],
-                    "Active Case",
-                ),
-                EmbedType.INACTIVE_CASE: (
-                    EMBED_COLORS["CASE"],
-                    EMBED_ICONS["INACTIVE_CASE"],
-                    "Inactive Case",
-                ),
-                EmbedType.NOTE: (EMBED_COLORS["NOTE"], EMBED_ICONS["NOTE"], "Note"),
-            }
-
-            embed.color = (
-                type_settings[embed_type][0] if custom_color is None else custom_color
-            )
+            type_color, type_icon, type_label = _EMBED_TYPE_SETTINGS[embed_type]
+
+            embed.color = type_color if custom_color is None else custom_color
             # Ensure color is a discord.Colour object
             if isinstance(embed.color, int):
                 embed.color = discord.Colour(embed.color)  # type: ignore
             elif embed.color is None or not isinstance(embed.color, discord.Colour):
-                embed.color = type_settings[embed_type][0]
+                embed.color = type_color
 
             if not hide_author:
                 embed.set_author(
-                    name=custom_author_text or type_settings[embed_type][2],
-                    icon_url=custom_author_icon_url or type_settings[embed_type][1],
+                    name=custom_author_text or type_label,
+                    icon_url=custom_author_icon_url or type_icon,
                     url=custom_author_text_url,
                 )
 
@@ -95,11 +95,13 @@ async def handle_callback_error(
     """
     logger.error(f"Error {operation} {context}: {error}", exc_info=True)
     error_msg = f"❌ Error {operation}: {error}"
+    send = (
+        interaction.followup.send
+        if interaction.response.is_done()
+        else interaction.response.send_message
+    )
     try:
-        if interaction.response.is_done():
-            await interaction.followup.send(error_msg, ephemeral=True)
-        else:
-            await interaction.response.send_message(error_msg, ephemeral=True)
+        await send(error_msg, ephemeral=True)
     except Exception as send_error:
         logger.error(f"Failed to send error message: {send_error}")
 
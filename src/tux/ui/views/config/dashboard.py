@@ -59,75 +59,22 @@ class ConfigDashboard(discord.ui.LayoutView):
     """
 
     # Button classes for Section accessories
-    class RanksButton(discord.ui.Button[discord.ui.LayoutView]):
-        """Button to open the Permission Ranks configuration mode."""
+    class ModeButton(discord.ui.Button[discord.ui.LayoutView]):
+        """Button to open a configuration mode (ranks, roles, commands or logs)."""
 
-        def __init__(self) -> None:
-            super().__init__(
-                label="Open",
-                style=discord.ButtonStyle.primary,
-                custom_id="btn_ranks",
-            )
-
-        async def callback(self, interaction: discord.Interaction) -> None:
-            """Handle button click to switch to ranks mode."""
-            view = self.view
-            if isinstance(view, ConfigDashboard):
-                view.current_mode = "ranks"
-                await view.build_layout()
-                await interaction.response.edit_message(view=view)
-
-    class RolesButton(discord.ui.Button[discord.ui.LayoutView]):
-        """Button to open the Role Assignments configuration mode."""
-
-        def __init__(self) -> None:
-            super().__init__(
-                label="Open",
-                style=discord.ButtonStyle.primary,
-                custom_id="btn_roles",
-            )
-
-        async def callback(self, interaction: discord.Interaction) -> None:
-            """Handle button click to switch to roles mode."""
-            view = self.view
-            if isinstance(view, ConfigDashboard):
-                view.current_mode = "roles"
-                await view.build_layout()
-                await interaction.response.edit_message(view=view)
-
-    class CommandsButton(discord.ui.Button[discord.ui.LayoutView]):
-        """Button to open the Command Permissions configuration mode."""
-
-        def __init__(self) -> None:
-            super().__init__(
-                label="Open",
-                style=discord.ButtonStyle.primary,
-                custom_id="btn_commands",
-            )
-
-        async def callback(self, interaction: discord.Interaction) -> None:
-            """Handle button click to switch to commands mode."""
-            view = self.view
-            if isinstance(view, ConfigDashboard):
-                view.current_mode = "commands"
-                await view.build_layout()
-                await interaction.response.edit_message(view=view)
-
-    class LogsButton(discord.ui.Button[discord.ui.LayoutView]):
-        """Button to open the Log Channels configuration mode."""
-
-        def __init__(self) -> None:
+        def __init__(self, mode: str) -> None:
             super().__init__(
                 label="Open",
                 style=discord.ButtonStyle.primary,
-                custom_id="btn_logs",
+                custom_id=f"btn_{mode}",
             )
+            self.mode = mode
 
         async def callback(self, interaction: discord.Interaction) -> None:
-            """Handle button click to switch to logs mode."""
+            """Handle button click to switch to this button's mode."""
             view = self.view
             if isinstance(view, ConfigDashboard):
-                view.current_mode = "logs"
+                view.current_mode = self.mode
                 await view.build_layout()
                 await interaction.response.edit_message(view=view)
 
@@ -308,7 +255,7 @@ class ConfigDashboard(discord.ui.LayoutView):
                 "Create and manage permission ranks that define access levels. "
                 "Ranks are numbered 0-10, with higher numbers granting more permissions.",
             ),
-            accessory=self.RanksButton(),
+            accessory=self.ModeButton("ranks"),
         )
         container.add_item(ranks_section)
 
@@ -319,7 +266,7 @@ class ConfigDashboard(discord.ui.LayoutView):
                 "Assign Discord roles to permission ranks. "
                 "Users with assigned roles will inherit the rank's permissions.",
             ),
-            accessory=self.RolesButton(),
+            accessory=self.ModeButton("roles"),
         )
         container.add_item(roles_section)
 
@@ -330,7 +277,7 @@ class ConfigDashboard(discord.ui.LayoutView):
                 "Control which commands require which permission rank. "
                 "Unassigned commands are disabled by default for security.",
             ),
-            accessory=self.CommandsButton(),
+            accessory=self.ModeButton("commands"),
         )
         container.add_item(commands_section)
 
@@ -341,7 +288,7 @@ class ConfigDashboard(discord.ui.LayoutView):
                 "Configure channels where bot events are logged. "
                 "Set up moderation logs, member events, and more.",
             ),
-            accessory=self.LogsButton(),
+            accessory=self.ModeButton("logs"),
         )
         container.add_item(logs_section)
 
@@ -2,6 +2,7 @@ import pytest
 from tux.database.controllers import (
     GuildController, GuildConfigController,
 )
+from tux.database.models import Guild
 
 
 # Test constants
@@ -57,6 +58,17 @@ class TestGuildController:
         retrieved = await guild_controller.get_guild_by_id(guild.id)
         assert retrieved is None
 
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_guild_exists(self, guild_controller: GuildController) -> None:
+        """Test existence check without loading the guild row."""
+        assert await guild_controller.exists(Guild.id == TEST_GUILD_ID) is False
+
+        await guild_controller.create_guild(guild_id=TEST_GUILD_ID)
+
+        assert await guild_controller.exists(Guild.id == TEST_GUILD_ID) is True
+        assert await guild_controller.exists(Guild.id == TEST_USER_ID) is False
+
 
 class TestGuildConfigController:
     """🚀 Test GuildConfig controller with professional patterns."""
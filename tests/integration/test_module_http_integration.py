@@ -81,7 +81,8 @@ class TestWikiModuleHTTP:
 
         request = httpx_mock.get_request()
         assert "wiki.archlinux.org" in str(request.url)
-        assert "Installation" in str(request.url)
+        assert "titles=Installation" in str(request.url)
+        assert "srsearch=Installation" in str(request.url)
 
     @pytest.mark.asyncio
     async def test_atl_wiki_api_call(self, httpx_mock) -> None:
@@ -123,6 +124,99 @@ class TestWikiModuleHTTP:
 
         assert result[0] == "error"
 
+    @pytest.mark.asyncio
+    async def test_wiki_html_response_is_rejected(self, httpx_mock) -> None:
+        """Test a non-JSON wiki response is treated as a failed request."""
+        from tux.modules.utility.wiki import Wiki
+
+        httpx_mock.add_response(
+            text="<html>Maintenance</html>",
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+        bot = MagicMock()
+        wiki = Wiki(bot)
+
+        result = await wiki.query_wiki(wiki.arch_wiki_api_url, "pacman")
+
+        assert result[0] == "error"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_wiki_invalid_query_skips_request(self, httpx_mock) -> None:
+        """Test empty and overlong search terms never reach the wiki API."""
+        from tux.modules.utility.wiki import Wiki
+
+        bot = MagicMock()
+        wiki = Wiki(bot)
+
+        empty = await wiki.query_wiki(wiki.arch_wiki_api_url, "   ")
+        overlong = await wiki.query_wiki(wiki.arch_wiki_api_url, "a" * 300)
+
+        assert empty[0] == "error"
+        assert overlong[0] == "error"
+        assert not httpx_mock.get_requests()
+
+    @pytest.mark.asyncio
+    async def test_wiki_exact_title_preferred_over_search(self, httpx_mock) -> None:
+        """Test an exact title match wins over the top full-text search hit."""
+        from tux.modules.utility.wiki import Wiki
+
+        mock_response = {
+            "query": {
+                "pages": {"7": {"pageid": 7, "title": "Systemd"}},
+                "search": [{"title": "Systemd/Timers"}],
+            },
+        }
+        httpx_mock.add_response(json=mock_response)
+
+        bot = MagicMock()
+        wiki = Wiki(bot)
+
+        result = await wiki.query_wiki(wiki.arch_wiki_api_url, "systemd")
+
+        assert result.title == "Systemd"
+        assert result.url == "https://wiki.archlinux.org/title/Systemd"
+
+    @pytest.mark.asyncio
+    async def test_wiki_repeated_query_is_cached(self, httpx_mock) -> None:
+        """Test repeated wiki searches are served from the result cache."""
+        from tux.modules.utility.wiki import Wiki
+
+        mock_response = {"query": {"pages": {"1": {"pageid": 1, "title": "Pacman"}}}}
+        httpx_mock.add_response(json=mock_response)
+
+        bot = MagicMock()
+        wiki = Wiki(bot)
+
+        first = await wiki.query_wiki(wiki.arch_wiki_api_url, "pacman")
+        second = await wiki.query_wiki(wiki.arch_wiki_api_url, "PACMAN")
+
+        assert first == second
+        assert first.title == "Pacman"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_wiki_result_sent_when_defer_fails(self, httpx_mock) -> None:
+        """Test a failed interaction defer does not discard the wiki result."""
+        from tux.modules.utility.wiki import Wiki
+
+        mock_response = {"query": {"pages": {"1": {"pageid": 1, "title": "Pacman"}}}}
+        httpx_mock.add_response(json=mock_response)
+
+        bot = MagicMock()
+        wiki = Wiki(bot)
+        wiki.create_embed = MagicMock()
+        ctx = MagicMock()
+        ctx.defer = AsyncMock(side_effect=RuntimeError("interaction expired"))
+        ctx.send = AsyncMock()
+
+        await wiki._send_wiki_result(ctx, wiki.arch_wiki_api_url, "pacman")
+
+        result = wiki.create_embed.call_args.args[0]
+        assert result.title == "Pacman"
+        ctx.send.assert_awaited_once_with(embed=wiki.create_embed.return_value)
+
 
 class TestImageEffectModuleHTTP:
     """Test image effect module HTTP functionality."""
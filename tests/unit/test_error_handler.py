@@ -1,6 +1,7 @@
 from typing import Any
 """Unit tests for error handler cog."""
 
+import dataclasses
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 import discord
@@ -69,6 +70,20 @@ class TestErrorHandler:
         assert isinstance(config, ErrorHandlerConfig)
         assert config.send_to_sentry is True
 
+    def test_get_error_config_reuses_resolution_per_type(self, error_handler) -> None:
+        """Test errors of the same type resolve to the same cached config."""
+        first = error_handler._get_error_config(RuntimeError("first"))
+        second = error_handler._get_error_config(RuntimeError("second"))
+
+        assert first is second
+
+    def test_get_error_config_shared_default_is_immutable(self, error_handler) -> None:
+        """Test the shared cached config cannot be mutated by one error."""
+        config = error_handler._get_error_config(RuntimeError("shared"))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.send_to_sentry = False
+
     @patch("tux.services.handlers.error.cog.logger")
     def test_log_error_with_sentry(self, mock_logger, error_handler) -> None:
         """Test _log_error with Sentry enabled."""
@@ -203,8 +203,6 @@ class TestHelpPermissionFiltering:
         mock_command: commands.Command[Any, Any, Any],
     ) -> None:
         """Test permission rank checking for commands."""
-        help_data = HelpData(mock_bot, mock_ctx)
-
         # Mock command to use permission system
         mock_command.callback.__uses_dynamic_permissions__ = True  # type: ignore[attr-defined]
 
@@ -219,17 +217,47 @@ class TestHelpPermissionFiltering:
         with patch("tux.help.data.get_permission_system", return_value=mock_perm_system), \
              patch.object(CONFIG.USER_IDS, "BOT_OWNER_ID", 111111111), \
              patch.object(CONFIG.USER_IDS, "SYSADMINS", []):
+            # The rank is cached per help session, so each user gets a fresh HelpData
             # User with rank 2 should not see command requiring rank 3
             mock_perm_system.get_user_permission_rank = AsyncMock(return_value=2)
-            assert not await help_data.can_run_command(mock_command)
+            assert not await HelpData(mock_bot, mock_ctx).can_run_command(mock_command)
 
             # User with rank 3 should see command requiring rank 3
             mock_perm_system.get_user_permission_rank = AsyncMock(return_value=3)
-            assert await help_data.can_run_command(mock_command)
+            assert await HelpData(mock_bot, mock_ctx).can_run_command(mock_command)
 
             # User with rank 5 should see command requiring rank 3
             mock_perm_system.get_user_permission_rank = AsyncMock(return_value=5)
-            assert await help_data.can_run_command(mock_command)
+            assert await HelpData(mock_bot, mock_ctx).can_run_command(mock_command)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_can_run_command_fetches_rank_once(
+        self,
+        mock_bot: MagicMock,
+        mock_ctx: commands.Context[Any],
+        mock_command: commands.Command[Any, Any, Any],
+    ) -> None:
+        """Test the user's permission rank is fetched once per help session."""
+        help_data = HelpData(mock_bot, mock_ctx)
+
+        # Mock command to use permission system
+        mock_command.callback.__uses_dynamic_permissions__ = True  # type: ignore[attr-defined]
+
+        mock_cmd_perm = MagicMock()
+        mock_cmd_perm.required_rank = 3
+
+        mock_perm_system = MagicMock()
+        mock_perm_system.get_command_permission = AsyncMock(return_value=mock_cmd_perm)
+        mock_perm_system.get_user_permission_rank = AsyncMock(return_value=5)
+
+        with patch("tux.help.data.get_permission_system", return_value=mock_perm_system), \
+             patch.object(CONFIG.USER_IDS, "BOT_OWNER_ID", 111111111), \
+             patch.object(CONFIG.USER_IDS, "SYSADMINS", []):
+            for _ in range(3):
+                assert await help_data.can_run_command(mock_command)
+
+        mock_perm_system.get_user_permission_rank.assert_awaited_once_with(mock_ctx)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
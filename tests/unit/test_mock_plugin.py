@@ -0,0 +1,150 @@
+"""
+🧪 Mock Plugin Autocomplete Tests
+
+Tests for the error autocompletes of the mock plugin.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from tux.plugins.atl.mock import Mock
+from tux.shared.constants import AUTOCOMPLETE_MAX_CHOICES
+
+
+class TestErrorTypeAutocomplete:
+    """🧪 Test error type autocomplete ordering and limits."""
+
+    @pytest.fixture
+    def mock_cog(self) -> Mock:
+        """Create a mock plugin cog with a mock bot."""
+        return Mock(MagicMock())
+
+    @staticmethod
+    def _display_names(mock_cog: Mock, names: list[str]) -> list[str]:
+        """Build the "[category] name" labels for the given error names."""
+        tests = mock_cog.error_registry.tests
+        return sorted(f"[{tests[name].category}] {name}" for name in names)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prefix_matches_are_ranked_first(self, mock_cog: Mock) -> None:
+        """Test names starting with the query come before names containing it."""
+        names = mock_cog.error_registry.get_test_names()
+        prefix = [name for name in names if name.lower().startswith("missing")]
+        substring = [
+            name
+            for name in names
+            if "missing" in name.lower() and not name.lower().startswith("missing")
+        ]
+        assert prefix
+        assert substring
+
+        choices = await mock_cog.error_type_autocomplete(MagicMock(), "Missing")
+
+        expected = (
+            self._display_names(mock_cog, prefix)
+            + self._display_names(mock_cog, substring)
+        )[:AUTOCOMPLETE_MAX_CHOICES]
+        assert [choice.name for choice in choices] == expected
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_substring_matches_are_sorted_by_label(self, mock_cog: Mock) -> None:
+        """Test a query matching only inside names returns them sorted by label."""
+        names = [
+            name
+            for name in mock_cog.error_registry.get_test_names()
+            if "quote" in name.lower()
+        ]
+        assert names
+        assert not any(name.lower().startswith("quote") for name in names)
+
+        choices = await mock_cog.error_type_autocomplete(MagicMock(), "quote")
+
+        assert [choice.name for choice in choices] == self._display_names(
+            mock_cog,
+            names,
+        )
+        assert {choice.value for choice in choices} == set(names)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_choices_are_capped(self, mock_cog: Mock) -> None:
+        """Test a query matching every error returns at most 25 choices."""
+        assert len(mock_cog.error_registry.tests) > AUTOCOMPLETE_MAX_CHOICES
+
+        choices = await mock_cog.error_type_autocomplete(MagicMock(), "")
+
+        assert [choice.name for choice in choices] == self._display_names(
+            mock_cog,
+            mock_cog.error_registry.get_test_names(),
+        )[:AUTOCOMPLETE_MAX_CHOICES]
+
+
+def _baseline_error_name_choices(
+    mock_cog: Mock,
+    category: str | None,
+    current: str,
+) -> list[tuple[str, str]]:
+    """Compute error name choices with the original linear scan, for reference."""
+    registry = mock_cog.error_registry
+    if not category:
+        available = [
+            "ValueError",
+            "RuntimeError",
+            "App_MissingRole_str",
+            "Cmd_MissingPermissions",
+            "Forbidden",
+            "App_CommandOnCooldown",
+            "Cmd_CommandOnCooldown",
+        ]
+    elif category == "All":
+        available = registry.get_test_names()
+    else:
+        available = registry.get_test_names_by_category().get(category, [])
+
+    choices = [
+        (
+            f"{name} [{registry.tests[name].category}]"
+            if category == "All" and name in registry.tests
+            else name,
+            name,
+        )
+        for name in available
+        if current.lower() in name.lower()
+    ]
+    choices.sort(key=lambda choice: choice[0])
+    return choices[:25]
+
+
+class TestErrorNameAutocomplete:
+    """🧪 Test the per-category error name index against a linear scan."""
+
+    @pytest.fixture
+    def mock_cog(self) -> Mock:
+        """Create a mock plugin cog with a mock bot."""
+        return Mock(MagicMock())
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "category",
+        [None, "All", "Traditional Commands", "Entity Not Found", "Unknown"],
+    )
+    @pytest.mark.parametrize("current", ["", "Missing", "notfound", "q", "zzz"])
+    async def test_matches_linear_scan(
+        self,
+        mock_cog: Mock,
+        category: str | None,
+        current: str,
+    ) -> None:
+        """Test the indexed autocomplete returns the same choices in the same order."""
+        interaction = MagicMock()
+        interaction.namespace.category = category
+
+        choices = await mock_cog.error_name_autocomplete(interaction, current)
+
+        assert [
+            (choice.name, choice.value) for choice in choices
+        ] == _baseline_error_name_choices(mock_cog, category, current)
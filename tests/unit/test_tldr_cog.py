@@ -0,0 +1,278 @@
+"""
+📖 TLDR Cog Tests
+
+Tests for the TLDR command autocomplete index and the rendered page cache.
+"""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tux.modules.tools.tldr import (
+    COMMAND_INDEX_CACHE_SIZE,
+    RENDERED_PAGES_CACHE_TTL_SECONDS,
+    Tldr,
+)
+from tux.services.wrappers.tldr import TldrPage
+from tux.shared.constants import AUTOCOMPLETE_MAX_CHOICES
+
+COMMAND_NAMES = [
+    "apt",
+    "bash",
+    "cat",
+    "git",
+    "git-commit",
+    "git-log",
+    "grep",
+    "legit",
+    "tar",
+    "zgit",
+]
+
+PAGE_CONTENT = (
+    "# tar\n\n"
+    "> Archiving utility.\n\n"
+    "- Create an archive:\n\n"
+    "`tar cf {{target.tar}} {{file}}`\n"
+)
+
+
+def _names(choices: list) -> list[str]:
+    """Return the values of autocomplete choices, in order."""
+    return [choice.value for choice in choices]
+
+
+class TestTldrCommandAutocomplete:
+    """📖 Test TLDR command autocomplete matching and caching."""
+
+    @pytest.fixture
+    def tldr_cog(self) -> Tldr:
+        """Create a TLDR cog with a mock bot."""
+        return Tldr(MagicMock())
+
+    @pytest.fixture
+    def interaction(self) -> MagicMock:
+        """Create a mock interaction with language and platform options set."""
+        interaction = MagicMock()
+        interaction.namespace.language = "en"
+        interaction.namespace.platform = "linux"
+        return interaction
+
+    @pytest.fixture
+    def list_commands(self) -> Iterator[MagicMock]:
+        """Patch the on-disk command listing with a fixed set of names."""
+        with patch(
+            "tux.modules.tools.tldr.TldrClient.list_tldr_commands",
+            return_value=COMMAND_NAMES,
+        ) as mock_list:
+            yield mock_list
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prefix_matches_come_before_substring_matches(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test names starting with the query are listed before other matches."""
+        choices = await tldr_cog.command_autocomplete(interaction, "Git")
+
+        assert _names(choices) == ["git", "git-commit", "git-log", "legit", "zgit"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_single_character_query_matches_prefix_only(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test a one-character query does not match in the middle of names."""
+        choices = await tldr_cog.command_autocomplete(interaction, "g")
+
+        assert _names(choices) == ["git", "git-commit", "git-log", "grep"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_choices_are_capped(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test prefix and substring matches stop at Discord's choice limit."""
+        names = [f"cmd-{i:03d}" for i in range(40)] + [f"x-cmd-{i}" for i in range(5)]
+        list_commands.return_value = names
+
+        choices = await tldr_cog.command_autocomplete(interaction, "cmd")
+
+        assert _names(choices) == names[:AUTOCOMPLETE_MAX_CHOICES]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_query_returns_first_commands(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test an empty query lists the first commands without filtering."""
+        list_commands.return_value = [f"cmd-{i:03d}" for i in range(40)]
+
+        choices = await tldr_cog.command_autocomplete(interaction, "")
+
+        assert _names(choices) == list_commands.return_value[:AUTOCOMPLETE_MAX_CHOICES]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_index_is_reused_between_keystrokes(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test the command directory is scanned once for repeated lookups."""
+        await tldr_cog.command_autocomplete(interaction, "g")
+        await tldr_cog.command_autocomplete(interaction, "gi")
+        await tldr_cog.command_autocomplete(interaction, "g")
+
+        list_commands.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_update_invalidates_index_and_memo(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test refreshed pages are picked up by autocomplete after a cache update."""
+        assert _names(await tldr_cog.command_autocomplete(interaction, "ne")) == []
+
+        list_commands.return_value = [*COMMAND_NAMES, "neofetch"]
+        with (
+            patch(
+                "tux.modules.tools.tldr.TldrClient.cache_needs_update",
+                return_value=True,
+            ),
+            patch(
+                "tux.modules.tools.tldr.TldrClient.update_tldr_cache",
+                return_value="Cache updated for language 'en'",
+            ),
+        ):
+            await tldr_cog._update_language_cache("en")
+
+        choices = await tldr_cog.command_autocomplete(interaction, "ne")
+
+        assert _names(choices) == ["neofetch"]
+        assert list_commands.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_update_keeps_other_languages(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test a cache update only drops the updated language's entries."""
+        await tldr_cog.command_autocomplete(interaction, "gi")
+
+        with (
+            patch(
+                "tux.modules.tools.tldr.TldrClient.cache_needs_update",
+                return_value=True,
+            ),
+            patch(
+                "tux.modules.tools.tldr.TldrClient.update_tldr_cache",
+                return_value="Cache updated for language 'es'",
+            ),
+        ):
+            await tldr_cog._update_language_cache("es")
+
+        await tldr_cog.command_autocomplete(interaction, "gi")
+
+        list_commands.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unknown_platforms_do_not_grow_index_cache(
+        self,
+        tldr_cog: Tldr,
+        interaction: MagicMock,
+        list_commands: MagicMock,
+    ) -> None:
+        """Test free-text platform values cannot grow the index cache unbounded."""
+        for i in range(COMMAND_INDEX_CACHE_SIZE * 2):
+            interaction.namespace.platform = f"junk-{i}"
+            await tldr_cog.command_autocomplete(interaction, "")
+
+        assert len(tldr_cog._command_index_cache) == COMMAND_INDEX_CACHE_SIZE
+        # The most recently used entries are the ones kept
+        assert ("en", f"junk-{COMMAND_INDEX_CACHE_SIZE * 2 - 1}") in (
+            tldr_cog._command_index_cache
+        )
+        assert ("en", "junk-0") not in tldr_cog._command_index_cache
+
+
+class TestTldrRenderedPagesCache:
+    """📖 Test reuse and expiry of rendered TLDR pages."""
+
+    @pytest.fixture
+    def tldr_cog(self) -> Tldr:
+        """Create a TLDR cog with a mock bot."""
+        return Tldr(MagicMock())
+
+    @pytest.fixture
+    def fetch_page(self) -> Iterator[MagicMock]:
+        """Patch page fetching with a fixed page found on the linux platform."""
+        with patch(
+            "tux.modules.tools.tldr.TldrClient.fetch_tldr_page",
+            return_value=TldrPage(PAGE_CONTENT, "linux"),
+        ) as mock_fetch:
+            yield mock_fetch
+
+    async def _render(self, tldr_cog: Tldr) -> tuple[str, list[str]]:
+        """Render the tar page for linux in English with longform options."""
+        return await tldr_cog._render_tldr_pages(
+            "tar",
+            "linux",
+            "en",
+            show_short=False,
+            show_long=True,
+            show_both=False,
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_recent_render_is_reused(
+        self,
+        tldr_cog: Tldr,
+        fetch_page: MagicMock,
+    ) -> None:
+        """Test a repeated lookup is served without fetching the page again."""
+        first = await self._render(tldr_cog)
+        second = await self._render(tldr_cog)
+
+        assert second == first
+        fetch_page.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stale_render_is_rendered_again(
+        self,
+        tldr_cog: Tldr,
+        fetch_page: MagicMock,
+    ) -> None:
+        """Test a render older than the page cache age fetches the page again."""
+        with patch("tux.modules.tools.tldr.time.monotonic", return_value=1000.0):
+            await self._render(tldr_cog)
+
+        stale_at = 1000.0 + RENDERED_PAGES_CACHE_TTL_SECONDS
+        with patch("tux.modules.tools.tldr.time.monotonic", return_value=stale_at):
+            await self._render(tldr_cog)
+            await self._render(tldr_cog)
+
+        assert fetch_page.call_count == 2
@@ -0,0 +1,76 @@
+"""
+🔬 Wolfram Cog Tests
+
+Tests for the Wolfram|Alpha result cache.
+"""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tux.modules.tools.wolfram import Wolfram
+from tux.shared.config import CONFIG
+
+
+class TestWolframResultCache:
+    """🔬 Test how Wolfram|Alpha queries are keyed in the result cache."""
+
+    @pytest.fixture
+    def wolfram_cog(self) -> Iterator[Wolfram]:
+        """Create a Wolfram cog with an app ID configured and sending stubbed out."""
+        with patch.object(CONFIG.EXTERNAL_SERVICES, "WOLFRAM_APP_ID", "test-app-id"):
+            cog = Wolfram(MagicMock())
+        cog._send_result = AsyncMock()
+        yield cog
+
+    @pytest.fixture
+    def fetch_image(self) -> Iterator[AsyncMock]:
+        """Patch the API request and image cropping."""
+        with (
+            patch(
+                "tux.modules.tools.wolfram.http_client.get",
+                new_callable=AsyncMock,
+            ) as mock_get,
+            patch(
+                "tux.modules.tools.wolfram._crop_result_image",
+                side_effect=lambda data: data,
+            ),
+        ):
+            mock_get.return_value.content = b"image"
+            yield mock_get
+
+    @staticmethod
+    async def _query(cog: Wolfram, query: str) -> None:
+        """Invoke the wolfram command for a query with a mock context."""
+        ctx = MagicMock()
+        ctx.defer = AsyncMock()
+        await Wolfram.wolfram.callback(cog, ctx, query=query)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_case_variants_are_cached_separately(
+        self,
+        wolfram_cog: Wolfram,
+        fetch_image: AsyncMock,
+    ) -> None:
+        """Test "Co" (cobalt) and "CO" (carbon monoxide) get their own entries."""
+        await self._query(wolfram_cog, "Co")
+        await self._query(wolfram_cog, "CO")
+
+        assert list(wolfram_cog._result_cache) == ["Co", "CO"]
+        assert fetch_image.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_whitespace_variants_share_an_entry(
+        self,
+        wolfram_cog: Wolfram,
+        fetch_image: AsyncMock,
+    ) -> None:
+        """Test queries differing only in spacing are answered from the cache."""
+        await self._query(wolfram_cog, "integrate x^2")
+        await self._query(wolfram_cog, "  integrate   x^2 ")
+
+        assert list(wolfram_cog._result_cache) == ["integrate x^2"]
+        fetch_image.assert_awaited_once()